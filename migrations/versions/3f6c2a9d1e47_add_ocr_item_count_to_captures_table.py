@@ -0,0 +1,34 @@
+"""Add ocr_item_count column to captures table
+
+Revision ID: 3f6c2a9d1e47
+Revises: b1b22439980d
+Create Date: 2026-10-16 10:12:41.118204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f6c2a9d1e47'
+down_revision: Union[str, Sequence[str], None] = 'b1b22439980d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('captures', sa.Column('ocr_item_count', sa.Integer(), nullable=False, server_default=sa.text('0')))
+    # Backfill from the OCR items already stored in metadata_json (SQLite JSON1)
+    op.execute(
+        "UPDATE captures SET ocr_item_count = json_array_length(metadata_json, '$.ocr_data.items') "
+        "WHERE type = 'screen' AND json_valid(metadata_json) "
+        "AND json_type(metadata_json, '$.ocr_data.items') = 'array'"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('captures', 'ocr_item_count')
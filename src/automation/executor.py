@@ -7,6 +7,7 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 import logging
+from PyQt6.QtCore import QObject, pyqtSlot
 
 logger = logging.getLogger(__name__)
 
@@ -30,8 +31,9 @@ class ExecutionResult:
     steps_completed: int = 0
 
 
-class WorkflowExecutor:
+class WorkflowExecutor(QObject):
     def __init__(self) -> None:
+        super().__init__()
         self.computer_use = ComputerUse(ComputerUseConfig())
         self._running = False
 
@@ -167,6 +169,7 @@ class WorkflowExecutor:
         """Check if a workflow is currently running"""
         return self._running
 
+    @pyqtSlot(dict)
     def execute_workflow_from_llm(self, workflow_data: Dict[str, Any]):
         """
         Receives a workflow dictionary from the LLM, converts it to WorkflowSteps,
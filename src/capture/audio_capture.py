@@ -12,7 +12,7 @@ from typing import Optional # Import Union
 import numpy as np
 import sounddevice as sd
 import soundfile as sf
-from PyQt6.QtCore import QObject, pyqtSignal
+from PyQt6.QtCore import QObject, QThread, pyqtSignal
 
 import logging
 
@@ -26,12 +26,15 @@ class AudioCaptureConfig:
     channels: int = 1
     segment_seconds: int = 30
     use_vad: bool = True
+    # Frames whose RMS (float samples, full scale 1.0) is at or below this skip webrtcvad
+    vad_energy_threshold: float = 0.001
     device: Optional[int] = None
 
 
 class AudioCapture(QObject):
 
     audio_file_ready = pyqtSignal(str)
+    file_written = pyqtSignal(str, int)  # path, size in bytes
 
     def __init__(self, output_dir: str | Path, config: AudioCaptureConfig) -> None:
         super().__init__()
@@ -72,6 +75,7 @@ class AudioCapture(QObject):
 
         segment = []
         samples_per_segment = self.config.segment_seconds * self.config.sample_rate
+        thread = QThread.currentThread()
 
         try:
             while True: # Loop indefinitely until explicitly broken
@@ -80,8 +84,8 @@ class AudioCapture(QObject):
                      chunk = self._q.get(timeout=0.5)
                 except queue.Empty:
                      # If queue times out, check if we should stop, otherwise continue
-                     if not self._running:
-                          logger.debug("Audio loop: self._running is False after queue timeout. Breaking loop.")
+                     if not self._running or thread.isInterruptionRequested():
+                          logger.debug("Audio loop: stop requested after queue timeout. Breaking loop.")
                           break
                      logger.debug("Audio queue timed out (no data received in 0.5s). Continuing loop.")
                      continue # Continue to next iteration
@@ -108,6 +112,7 @@ class AudioCapture(QObject):
                     try:
                         sf.write(path, buf, self.config.sample_rate, subtype="PCM_16")
                         logger.info("Saved audio segment %s", path.name)
+                        self.file_written.emit(str(path), path.stat().st_size)
                         self.audio_file_ready.emit(str(path))
                     except Exception as write_e:
                         logger.exception(f"Failed to write audio segment {path.name}: {write_e}")
@@ -136,9 +141,17 @@ class AudioCapture(QObject):
         frame_ms = 30
         samples_per_frame = int(self.config.sample_rate * frame_ms / 1000)
         mono = chunk[:, 0] if chunk.ndim > 1 else chunk
-        mono = (mono * 32767).astype(np.int16)
-        for i in range(0, len(mono) - samples_per_frame, samples_per_frame):
-            frame = mono[i : i + samples_per_frame]
+        n_frames = (len(mono) - 1) // samples_per_frame
+        if n_frames <= 0:
+            return False
+        frames = np.asarray(mono[: n_frames * samples_per_frame], dtype=np.float32).reshape(n_frames, samples_per_frame)
+        # Per-frame RMS in one vectorized pass; near-silent frames never reach webrtcvad
+        rms = np.sqrt(np.einsum("ij,ij->i", frames, frames) / samples_per_frame)
+        loud = np.flatnonzero(rms > self.config.vad_energy_threshold)
+        if loud.size == 0:
+            return False
+        pcm = (frames[loud] * 32767).astype(np.int16)
+        for frame in pcm:
             if self._vad.is_speech(frame.tobytes(), self.config.sample_rate):
                 return True
         return False
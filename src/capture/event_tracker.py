@@ -1,13 +1,14 @@
 from __future__ import annotations
 
-import json
+import os
 import threading
 import time
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Iterable, List, Optional
 
 import logging
+import orjson
 from PyQt6.QtCore import QObject
 
 logger = logging.getLogger(__name__)
@@ -23,9 +24,23 @@ except Exception:  # pragma: no cover
     psutil = None
 
 
+# Buffered event lines are appended to the log once either limit is reached
+FLUSH_EVENTS = 64
+FLUSH_INTERVAL_SEC = 1.0
+
+_LOG_OPEN_FLAGS = os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, "O_BINARY", 0)
+
+
 @dataclass
 class EventTrackerConfig:
     log_path: Path
+    exclude_apps: Iterable[str] = ()  # Process names whose input is never logged
+
+
+def _app_key(name: str) -> str:
+    """Case-insensitive match key for process names, so "KeePass" also matches "keepass.exe"."""
+    key = name.strip().lower()
+    return key[:-4] if key.endswith(".exe") else key
 
 
 class EventTracker(QObject):
@@ -36,24 +51,65 @@ class EventTracker(QObject):
         self._mouse_listener = None
         self._keyboard_listener = None
         self._running = False
+        # Checked on every logged event, so keep it as a set
+        self._excluded_apps = frozenset(_app_key(app) for app in config.exclude_apps if app.strip())
+        # Serialized lines waiting to be appended; the mouse and keyboard listeners log
+        # from their own threads, hence the lock
+        self._buf: List[bytes] = []
+        self._buf_lock = threading.Lock()
+        self._last_flush = time.monotonic()
+        # Append-only descriptor kept open between flushes; closed in stop()
+        self._fd: Optional[int] = None
 
     def _log(self, event_type: str, details: Dict[str, Any]) -> None:
         # Check if running before logging to prevent logs after stop request
         if not self._running:
             logger.debug(f"Event logging skipped as tracker is stopped (Event: {event_type})")
             return
+        app = self._active_process_name()
+        if app and _app_key(app) in self._excluded_apps:
+            return
         entry = {
             "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
             "event_type": event_type,
             "window": self._active_window_title(),
-            "app": self._active_process_name(),
+            "app": app,
             "details": details,
         }
+        line = orjson.dumps(entry, option=orjson.OPT_APPEND_NEWLINE)
+        with self._buf_lock:
+            self._buf.append(line)
+            if len(self._buf) >= FLUSH_EVENTS or time.monotonic() - self._last_flush >= FLUSH_INTERVAL_SEC:
+                self._flush_locked()
+
+    def flush(self) -> None:
+        """Appends any buffered events to the log file."""
+        with self._buf_lock:
+            self._flush_locked()
+
+    def _flush_locked(self) -> None:
+        self._last_flush = time.monotonic()
+        if not self._buf:
+            return
+        lines, self._buf = self._buf, []
         try:
-            with self.config.log_path.open("a", encoding="utf-8") as f:
-                f.write(json.dumps(entry) + "\n")
+            if self._fd is None:
+                self._fd = os.open(self.config.log_path, _LOG_OPEN_FLAGS, 0o644)
+            data = memoryview(b"".join(lines))
+            while data:
+                data = data[os.write(self._fd, data):]
         except Exception as e:
-            logger.error(f"Failed to write event log entry: {e}")
+            logger.error(f"Failed to write {len(lines)} event log entries: {e}")
+
+    def _close_log(self) -> None:
+        with self._buf_lock:
+            self._flush_locked()
+            if self._fd is not None:
+                try:
+                    os.close(self._fd)
+                except OSError as e:
+                    logger.debug("Closing event log failed: %s", e)
+                self._fd = None
 
 
     def _active_window_title(self) -> str:
@@ -149,4 +205,5 @@ class EventTracker(QObject):
         # Reset listener attributes after attempting to stop
         self._mouse_listener = None
         self._keyboard_listener = None
+        self._close_log() # Nothing more will be logged; write out what is buffered
         logger.info("Event tracker stop sequence completed.") # Changed log message
@@ -11,7 +11,7 @@ import numpy as np
 from PIL import Image
 import logging
 import cv2  # Import OpenCV
-from PyQt6.QtCore import QObject, pyqtSignal
+from PyQt6.QtCore import QObject, QThread, pyqtSignal
 from src.utils import ensure_dirs
 
 logger = logging.getLogger(__name__)
@@ -33,6 +33,7 @@ class ScreenCaptureConfig:
 class ScreenCapture(QObject):
 
     video_file_ready = pyqtSignal(str)
+    file_written = pyqtSignal(str, int)  # path, size in bytes
 
     def __init__(self, output_dir: str | Path, config: ScreenCaptureConfig) -> None:
         super().__init__()
@@ -76,9 +77,9 @@ class ScreenCapture(QObject):
             monitor = self._mss.monitors[monitor_index]
             sct_img = self._mss.grab(monitor)
             logger.debug("mss.grab() successful.")
-            frame = np.array(sct_img)
-            frame = frame[:, :, :3]
-            frame = cv2.cvtColor(frame, cv2.COLOR_BGRA2BGR)
+            # View the BGRA screenshot buffer in place; dropping alpha is then the only copy,
+            # and it yields the contiguous BGR frame that cv2 consumers expect
+            frame = cv2.cvtColor(np.asarray(sct_img), cv2.COLOR_BGRA2BGR)
             resized_frame = self._resize_if_needed(frame)
             logger.debug("Frame grabbed and processed successfully.")
             return resized_frame
@@ -90,8 +91,9 @@ class ScreenCapture(QObject):
     def _frame_difference_ratio(self, a: np.ndarray, b: np.ndarray) -> float:
         if a.shape != b.shape:
             return 1.0
-        diff = np.mean(np.abs(a.astype(np.int16) - b.astype(np.int16))) / 255.0
-        return float(diff)
+        # Mean absolute difference scaled to [0, 1]; cv2.norm sums |a - b| in one pass
+        # without materializing widened copies or a difference frame
+        return float(cv2.norm(a, b, cv2.NORM_L1) / (a.size * 255.0))
 
     def _should_save(self, frame: np.ndarray) -> bool:
         if self._previous_frame is None:
@@ -107,8 +109,15 @@ class ScreenCapture(QObject):
         # Save with cv2
         img = Image.fromarray(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB))
         img.save(path, format=self.config.format.upper(), quality=self.config.quality)
+        self._report_written(path)
         return path
 
+    def _report_written(self, path: Path) -> None:
+        try:
+            self.file_written.emit(str(path), path.stat().st_size)
+        except OSError as e:
+            logger.debug("Could not stat written file %s: %s", path, e)
+
     def _start_video_segment(self, frame: np.ndarray) -> None:
         ts = time.strftime("%Y%m%d_%H%M%S", time.localtime())
         self._current_video_path = self.output_dir / f"video_{ts}.mp4"
@@ -132,6 +141,7 @@ class ScreenCapture(QObject):
             logger.info("Completed video segment: %s", self._current_video_path)
             
             if self._current_video_path:
+                self._report_written(self._current_video_path)
                 logger.debug("Calling process_and_delete_video for %s", self._current_video_path)
                 self.process_and_delete_video(self._current_video_path)
             else:
@@ -160,8 +170,10 @@ class ScreenCapture(QObject):
         interval = 1.0 / max(1, self.config.fps)
         logger.info("Screen capture started at %d FPS", self.config.fps)
 
+        thread = QThread.currentThread()
         try:
-            while self._running:
+            # stop() clears the flag; the owning thread can also ask us to exit
+            while self._running and not thread.isInterruptionRequested():
                 t0 = time.time()
                 logger.debug("Screen capture loop: calling _grab()...")
                 frame = self._grab()
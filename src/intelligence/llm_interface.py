@@ -18,6 +18,34 @@ except ImportError:
     )
     sys.exit()
 
+# Prompt text is fixed; only the three log sections change between calls
+_SYSTEM_PROMPT = (
+    "You are an AI assistant analyzing user interaction logs (screen OCR, audio transcripts, UI events). "
+    "Your goal is to identify and describe workflows, focusing on repetitive patterns. "
+    "Provide a concise summary, list the distinct steps involved, determine if the overall pattern seems repetitive, "
+    "and estimate its automation potential. "
+    "Respond ONLY with a valid JSON object containing keys: "
+    "'workflow_summary' (string, concise description, e.g., 'Filling expense report in Excel'), "
+    "'steps' (list of strings, describing each distinct action, e.g., ['Click Save button', 'Type filename', 'Press Enter']), "
+    "'is_repetitive' (boolean, true if the sequence of actions seems repeated), "
+    "'automation_potential' (string: 'low', 'medium', 'high'). "
+    "Be factual and base your analysis strictly on the provided logs."
+)
+
+_USER_PROMPT_TEMPLATE = "\n".join([
+    "Analyze the following user activity logs recorded sequentially. Identify the primary workflow, list its key steps, determine if it's repetitive, and estimate automation potential.\n",
+    "=== Screen States (App & Window Title) ===",
+    "{screens}",
+    "\n=== Audio Transcripts ===",
+    "{transcripts}",
+    "\n=== UI Events ===",
+    "{events}",
+    "\n=== Analysis Request ===",
+    "Based ONLY on the logs above, provide your analysis as a single JSON object with keys: 'workflow_summary', 'steps' (list of strings), 'is_repetitive' (boolean), 'automation_potential' ('low'/'medium'/'high')."
+])
+
+_REQUIRED_KEYS = frozenset({"workflow_summary", "steps", "is_repetitive", "automation_potential"})
+
 
 @dataclass
 class LLMConfig:
@@ -81,25 +109,12 @@ class LocalLLM:
 
 
         try:
-            # More specific system prompt
-            system_prompt = (
-                "You are an AI assistant analyzing user interaction logs (screen OCR, audio transcripts, UI events). "
-                "Your goal is to identify and describe workflows, focusing on repetitive patterns. "
-                "Provide a concise summary, list the distinct steps involved, determine if the overall pattern seems repetitive, "
-                "and estimate its automation potential. "
-                "Respond ONLY with a valid JSON object containing keys: "
-                "'workflow_summary' (string, concise description, e.g., 'Filling expense report in Excel'), "
-                "'steps' (list of strings, describing each distinct action, e.g., ['Click Save button', 'Type filename', 'Press Enter']), "
-                "'is_repetitive' (boolean, true if the sequence of actions seems repeated), "
-                "'automation_potential' (string: 'low', 'medium', 'high'). "
-                "Be factual and base your analysis strictly on the provided logs."
-            )
             chat_messages = [
-                {"role": "system", "content": system_prompt},
+                {"role": "system", "content": _SYSTEM_PROMPT},
                 {"role": "user", "content": prompt}
             ]
 
-            logger.debug(f"Sending prompt to LLM (approx {len(prompt)} chars)...")
+            logger.debug("Sending prompt to LLM (approx %d chars)...", len(prompt))
             response = self._llm.create_chat_completion(
                 messages=chat_messages, # type: ignore
                 temperature=self.config.temperature,
@@ -123,7 +138,7 @@ class LocalLLM:
                 return {"workflow_summary": "LLM returned no content.", **default_response} # Add specific error
 
             text = content.strip()
-            logger.debug(f"LLM raw response: {text[:500]}...") # Log beginning of response
+            logger.debug("LLM raw response: %s...", text[:500]) # Log beginning of response
             return self._safe_json(text)
 
         except Exception as e:
@@ -148,24 +163,17 @@ class LocalLLM:
             for e in events_for_llm
         ]
 
-        prompt_parts = [
-            "Analyze the following user activity logs recorded sequentially. Identify the primary workflow, list its key steps, determine if it's repetitive, and estimate automation potential.\n",
-            "=== Screen States (App & Window Title) ===" ,
-            "\n".join(screen_summaries) if screen_summaries else "No screen data.",
-            "\n=== Audio Transcripts ===",
-            "\n".join(f"- {t}" for t in transcripts) if transcripts else "No audio transcripts.",
-            "\n=== UI Events ===",
-            "\n".join(event_summaries) if event_summaries else "No UI events.",
-            "\n=== Analysis Request ===",
-            "Based ONLY on the logs above, provide your analysis as a single JSON object with keys: 'workflow_summary', 'steps' (list of strings), 'is_repetitive' (boolean), 'automation_potential' ('low'/'medium'/'high')."
-        ]
-        return "\n".join(prompt_parts)
+        return _USER_PROMPT_TEMPLATE.format(
+            screens="\n".join(screen_summaries) if screen_summaries else "No screen data.",
+            transcripts="\n".join(f"- {t}" for t in transcripts) if transcripts else "No audio transcripts.",
+            events="\n".join(event_summaries) if event_summaries else "No UI events.",
+        )
 
 
     def _safe_json(self, text: str) -> Dict[str, Any]:
         """Attempts to parse JSON, cleaning common LLM output issues."""
         text = text.strip()
-        logger.debug(f"Attempting to parse JSON from: {text[:500]}...")
+        logger.debug("Attempting to parse JSON from: %s...", text[:500])
 
         # Find the start and end of the JSON object
         try:
@@ -180,8 +188,7 @@ class LocalLLM:
         try:
             parsed_json = json.loads(json_text)
             # --- Added validation ---
-            required_keys = {"workflow_summary", "steps", "is_repetitive", "automation_potential"}
-            if not isinstance(parsed_json, dict) or not required_keys.issubset(parsed_json.keys()):
+            if not isinstance(parsed_json, dict) or not _REQUIRED_KEYS.issubset(parsed_json.keys()):
                  logger.warning(f"Parsed JSON missing required keys: {parsed_json}")
                  # Try to salvage what's there, but fill defaults
                  parsed_json = {
@@ -14,7 +14,6 @@ from .ui.main_window import MainWindow
 from .ui.tray_icon import TrayIcon
 from .storage.cleanup import cleanup_old_files, cleanup_size_limit, physical_cleanup_deleted_records
 from .storage.database import initialize_database
-from .automation.executor import WorkflowExecutor
 
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 APP_NAME = "ComputerUseAI"
@@ -70,22 +69,17 @@ def main() -> int:
     window = MainWindow(settings, PROJECT_ROOT)
     
     # Create tray icon
-    tray_icon = TrayIcon()
+    tray_icon = TrayIcon(recording_actions=(window.start_action, window.stop_action))
 
-    # Initialize WorkflowExecutor
-    workflow_executor = WorkflowExecutor()
-    
-    # Connect workflow_detected signal from pipeline to executor
-    if window.processing_pipeline:
-        window.processing_pipeline.workflow_detected.connect(workflow_executor.execute_workflow_from_llm)
+    # Detected workflows are handled by MainWindow, which owns the executor thread
+    # and only auto-executes when automation is enabled
     
     # Connect tray signals
     tray_icon.show_window.connect(window.show)
     tray_icon.show_window.connect(window.raise_)
     tray_icon.show_window.connect(window.activateWindow)
     tray_icon.show_settings.connect(window.show_settings_tab)
-    tray_icon.start_recording.connect(window.start_recording)
-    tray_icon.stop_recording.connect(window.stop_recording)
+    # Start/stop go through the window's shared actions passed to the tray above
     
     # Connect quit signal to the app itself
     tray_icon.quit_app.connect(app.quit)
@@ -1,10 +1,15 @@
 from __future__ import annotations
 
+import math
+import re
 from collections import Counter
 from typing import Any, Dict, List, Tuple
 
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
+# TfidfVectorizer's default tokenizer (lowercased words of 2+ characters)
+_TOKEN_RE = re.compile(r"(?u)\b\w\w+\b")
+# Smoothed IDF over a two-document corpus: ln((1 + 2) / (1 + df)) + 1
+_IDF_SHARED = 1.0
+_IDF_UNIQUE = 1.0 + math.log(1.5)
 
 
 def extract_workflow_signature(workflow: Dict[str, Any]) -> str:
@@ -14,41 +19,67 @@ def extract_workflow_signature(workflow: Dict[str, Any]) -> str:
     return f"{app} | {actions} | {text}"
 
 
+def _signature_terms(workflow: Dict[str, Any]) -> Counter:
+    return Counter(_TOKEN_RE.findall(extract_workflow_signature(workflow).lower()))
+
+
+def _weighted_norm(terms: Counter, other: Counter) -> float:
+    return math.sqrt(sum(
+        (count * (_IDF_SHARED if term in other else _IDF_UNIQUE)) ** 2
+        for term, count in terms.items()
+    ))
+
+
+def _terms_similarity(terms1: Counter, terms2: Counter) -> float:
+    # TF-IDF cosine fitted on just the two signatures, as TfidfVectorizer would
+    # compute it; shared terms have IDF 1 so the dot product is plain counts
+    norm = _weighted_norm(terms1, terms2) * _weighted_norm(terms2, terms1)
+    if norm == 0.0:
+        return 0.0
+    dot = sum(count * terms2[term] for term, count in terms1.items() if term in terms2)
+    return dot / norm
+
+
 def calculate_similarity(workflow1: Dict[str, Any], workflow2: Dict[str, Any]) -> float:
-    vec = TfidfVectorizer().fit([
-        extract_workflow_signature(workflow1),
-        extract_workflow_signature(workflow2),
-    ])
-    a = vec.transform([extract_workflow_signature(workflow1)])
-    b = vec.transform([extract_workflow_signature(workflow2)])
-    sim = cosine_similarity(a, b)[0][0]
-    return float(sim)
+    return _terms_similarity(_signature_terms(workflow1), _signature_terms(workflow2))
 
 
 def detect_repetitive_patterns(workflows: List[Dict[str, Any]], threshold: float = 0.85) -> List[Dict[str, Any]]:
     patterns: List[Dict[str, Any]] = []
-    used = set()
-    for i in range(len(workflows)):
-        if i in used:
+    # Similarity depends only on a signature's term counts, so workflows sharing them
+    # are bucketed by a hash and each pair of distinct buckets is scored once
+    buckets: Dict[frozenset, Tuple[Counter, List[int]]] = {}
+    for idx, workflow in enumerate(workflows):
+        terms = _signature_terms(workflow)
+        buckets.setdefault(frozenset(terms.items()), (terms, []))[1].append(idx)
+
+    # A bucket similar to itself always lands in one group; otherwise its members stand alone
+    units: List[Tuple[int, Counter, int]] = []  # (first workflow index, terms, workflow count)
+    for terms, members in buckets.values():
+        if _terms_similarity(terms, terms) >= threshold:
+            units.append((members[0], terms, len(members)))
+        else:
+            units.extend((idx, terms, 1) for idx in members)
+    units.sort(key=lambda unit: unit[0])
+
+    used = [False] * len(units)
+    for a, (first, terms, count) in enumerate(units):
+        if used[a]:
             continue
-        group = [workflows[i]]
-        used.add(i)
-        for j in range(i + 1, len(workflows)):
-            if j in used:
-                continue
-            if calculate_similarity(workflows[i], workflows[j]) >= threshold:
-                group.append(workflows[j])
-                used.add(j)
-        if len(group) >= 3:
+        used[a] = True
+        occurrences = count
+        for b in range(a + 1, len(units)):
+            if not used[b] and _terms_similarity(terms, units[b][1]) >= threshold:
+                used[b] = True
+                occurrences += units[b][2]
+        if occurrences >= 3:
             patterns.append(
                 {
-                    "pattern_id": f"pattern_{i}",
-                    "occurrences": len(group),
-                    "workflow_template": group[0],
+                    "pattern_id": f"pattern_{first}",
+                    "occurrences": occurrences,
+                    "workflow_template": workflows[first],
                     "confidence": 0.9,
                     "suggested_automation": "Auto-execute common steps",
                 }
             )
     return patterns
-
-
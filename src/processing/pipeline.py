@@ -3,12 +3,14 @@
 from __future__ import annotations
 
 import logging
+import queue
+import time
 from pathlib import Path
 import cv2, pytz
 import numpy as np
 from datetime import datetime, timedelta # Added timedelta
 
-from PyQt6.QtCore import QObject, pyqtSignal, pyqtSlot, QTimer
+from PyQt6.QtCore import QObject, QThread, pyqtSignal, pyqtSlot, QTimer
 
 from .speech_to_text import SpeechToText, STTConfig
 from .ocr_engine import OCREngine, OCRConfig
@@ -28,6 +30,13 @@ class ProcessingPipeline(QObject):
 
     # Signal to update the UI with a new workflow
     workflow_detected = pyqtSignal(dict)
+    # Signal emitted when a capture backlog queue passes 75% of its capacity: (kind, depth)
+    backlog_warning = pyqtSignal(str, int)
+
+    # Max files handed to process_audio/process_video per drain tick
+    DRAIN_BATCH_SIZE = 4
+    # Backlog capacity per kind when processing.queue_size is unset or invalid
+    DEFAULT_QUEUE_SIZE = 8
 
     # Accept project_root in the constructor
     def __init__(self, settings: dict, project_root: Path):
@@ -67,6 +76,22 @@ class ProcessingPipeline(QObject):
         self.analysis_timer.timeout.connect(self.run_analysis)
         self.analysis_interval_sec = settings.get("processing", {}).get("analysis_interval_sec", 60) # Store interval
 
+        # Bounded backlog between the capture threads and this pipeline. Producers call
+        # enqueue_audio/enqueue_video directly from their own thread; the drain timer
+        # consumes on the pipeline thread. On overflow the oldest entry is dropped instead of growing unbounded.
+        queue_size = settings.get("processing", {}).get("queue_size", self.DEFAULT_QUEUE_SIZE)
+        # queue.Queue treats 0 (or less) as unbounded, which would defeat the backpressure
+        if not isinstance(queue_size, int) or queue_size < 1:
+            logger.warning(f"Invalid processing.queue_size {queue_size!r}; using {self.DEFAULT_QUEUE_SIZE}")
+            queue_size = self.DEFAULT_QUEUE_SIZE
+        self._audio_q: queue.Queue[str] = queue.Queue(maxsize=queue_size)
+        self._video_q: queue.Queue[str] = queue.Queue(maxsize=queue_size)
+        self.drain_timer = QTimer(self)
+        self.drain_timer.timeout.connect(self.drain_queues)
+        self.drain_interval_ms = settings.get("processing", {}).get("drain_interval_ms", 500)
+        # time.monotonic() after which draining stops; set from the GUI thread on exit
+        self._drain_deadline: float | None = None
+
         logger.info("ProcessingPipeline initialized")
 
     @pyqtSlot()
@@ -78,6 +103,7 @@ class ProcessingPipeline(QObject):
             return
 
         analysis_interval_ms = self.analysis_interval_sec * 1000
+        self.drain_timer.start(self.drain_interval_ms)
         self.analysis_timer.start(analysis_interval_ms)
         logger.info(f"ProcessingPipeline started analysis timer with interval: {analysis_interval_ms / 1000} seconds")
         # Run analysis immediately on start as well
@@ -87,6 +113,10 @@ class ProcessingPipeline(QObject):
     @pyqtSlot()
     def stop(self):
         """Stops the periodic analysis timer."""
+        self.drain_timer.stop()
+        # Process whatever the capture threads handed over before they stopped
+        self.drain_queues(batch_size=None)
+
         if not self.analysis_timer.isActive():
             logger.warning("Analysis timer is not active. Ignoring stop request.")
             return
@@ -94,6 +124,80 @@ class ProcessingPipeline(QObject):
         self.analysis_timer.stop()
         logger.info("ProcessingPipeline stopped analysis timer.")
 
+    def set_drain_deadline(self, deadline: float | None):
+        """Thread-safe: bounds every drain to finish taking files by this time.monotonic() value."""
+        self._drain_deadline = deadline
+
+    @pyqtSlot()
+    def shutdown(self):
+        """Stops the timers, drains what the drain deadline allows and quits the pipeline thread."""
+        self.analysis_timer.stop()
+        self.drain_timer.stop()
+        self.drain_queues(batch_size=None)
+        left = self.queue_depth
+        if left:
+            logger.warning(f"Exiting with {left} captured segments left unprocessed on disk")
+        # Quitting from inside the thread guarantees this slot ran before its event loop ends
+        QThread.currentThread().quit()
+
+    def enqueue_audio(self, file_path_str: str):
+        """Thread-safe producer entry point for finished audio segments."""
+        self._enqueue(self._audio_q, "audio", file_path_str)
+
+    def enqueue_video(self, file_path_str: str):
+        """Thread-safe producer entry point for finished video segments."""
+        self._enqueue(self._video_q, "video", file_path_str)
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of captured segments waiting to be processed, across both backlogs."""
+        return self._audio_q.qsize() + self._video_q.qsize()
+
+    def _enqueue(self, q: queue.Queue, kind: str, file_path_str: str):
+        while True:
+            try:
+                q.put_nowait(file_path_str)
+                break
+            except queue.Full:
+                self._drop_oldest(q, kind)
+        depth = q.qsize()
+        if depth * 4 >= q.maxsize * 3:
+            logger.warning(f"{kind} processing backlog at {depth}/{q.maxsize}")
+            self.backlog_warning.emit(kind, depth)
+
+    @staticmethod
+    def _drop_oldest(q: queue.Queue, kind: str):
+        """Coalesces a full backlog by discarding its oldest segment; the newest is more relevant."""
+        try:
+            dropped = q.get_nowait()
+        except queue.Empty:
+            return # The drain timer freed a slot in the meantime
+        logger.warning(f"{kind} processing backlog is full ({q.maxsize}); dropping oldest {dropped}")
+        # Nothing will ever record or process it, so size-based cleanup could not reclaim it
+        try:
+            Path(dropped).unlink(missing_ok=True)
+        except OSError as e:
+            logger.warning(f"Failed to delete dropped {kind} file {dropped}: {e}")
+
+    @pyqtSlot()
+    def drain_queues(self, batch_size: int | None = DRAIN_BATCH_SIZE) -> int:
+        """Processes up to batch_size queued files per kind (all of them if None). Returns the count."""
+        processed = 0
+        for q, handler in ((self._audio_q, self.process_audio), (self._video_q, self.process_video)):
+            taken = 0
+            while batch_size is None or taken < batch_size:
+                deadline = self._drain_deadline
+                if deadline is not None and time.monotonic() >= deadline:
+                    return processed + taken
+                try:
+                    file_path_str = q.get_nowait()
+                except queue.Empty:
+                    break
+                handler(file_path_str)
+                taken += 1
+            processed += taken
+        return processed
+
     @pyqtSlot(str)
     def process_audio(self, file_path_str: str):
         """Slot to process a new audio file."""
@@ -183,7 +287,8 @@ class ProcessingPipeline(QObject):
                                 type="screen", # Treat video frame analysis as screen capture
                                 file_path=file_path_str, # Link DB record to original video file name
                                 size_bytes=file_path.stat().st_size,
-                                metadata_json={"ocr_data": ocr_items_metadata} # Store OCR items
+                                metadata_json={"ocr_data": ocr_items_metadata}, # Store OCR items
+                                ocr_item_count=len(ocr_items_metadata["items"]),
                             )
                             session.add(new_capture)
                             session.commit()
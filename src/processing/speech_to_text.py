@@ -30,9 +30,9 @@ class SpeechToText:
         # It's more reliable and handles its own model downloading/caching.
         if self.config.engine == "faster-whisper":
             try:
+                # faster-whisper runs on CTranslate2; it needs neither torch nor transformers,
+                # and importing them here only to probe for them cost seconds at startup
                 from faster_whisper import WhisperModel  # type: ignore
-                import torch # Check for torch as well
-                import transformers # Check for transformers as well
 
                 # Use config.model_path.as_posix() to pass the model *name* (e.g., "base")
                 model_name = self.config.model_path.as_posix()
@@ -40,9 +40,9 @@ class SpeechToText:
                 logger.info(f"Initialized faster-whisper with model: {model_name}")
             except ImportError:
                 logger.warning(
-                    "Faster-whisper or its dependencies (torch, transformers) not found. "
+                    "Faster-whisper not found. "
                     "Speech-to-text functionality will be disabled. "
-                    "Please install them manually if needed (e.g., pip install faster-whisper torch transformers)."
+                    "Please install it manually if needed (e.g., pip install faster-whisper)."
                 )
                 self._engine = None
             except Exception as e:
@@ -1,17 +1,21 @@
 from __future__ import annotations
 
+import os
 from pathlib import Path
 from typing import Iterable, Callable, Any
 from datetime import datetime, timezone, timedelta
 
 import logging
 
-from sqlalchemy import select, func
+from sqlalchemy import select, func, update
 
 from src.storage.database import Capture, Event # Import necessary models and initializer
 
 logger = logging.getLogger(__name__)
 
+# Rows fetched per round trip while streaming the oldest captures, and ids per UPDATE
+_SIZE_CLEANUP_BATCH = 500
+
 
 def cleanup_old_files(session_factory: Callable[..., Any], directories: Iterable[str | Path], max_age_days: int) -> int:
     """
@@ -53,17 +57,24 @@ def cleanup_old_files(session_factory: Callable[..., Any], directories: Iterable
     # Also clean up physical files that are older than max_age_days, regardless of DB status
     # This acts as a failsafe for files not linked to DB records or if DB cleanup fails
     physical_removed_count = 0
-    for d in directories:
-        for p in Path(d).glob("**/*"):
-            if p.is_file():
-                try:
-                    file_mtime_utc = datetime.fromtimestamp(p.stat().st_mtime, tz=timezone.utc)
-                    if file_mtime_utc < cutoff_date:
-                        p.unlink()
-                        physical_removed_count += 1
-                        logger.debug(f"Physically deleted old file: {p}")
-                except Exception as e:
-                    logger.debug(f"Failed to physically remove old file {p}: {e}")
+    cutoff_ts = cutoff_date.timestamp()
+    # os.scandir entries carry the file type from readdir, so only regular files are stat'ed
+    stack = [os.fspath(d) for d in directories]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.is_file() and entry.stat().st_mtime < cutoff_ts:
+                            os.unlink(entry.path)
+                            physical_removed_count += 1
+                            logger.debug(f"Physically deleted old file: {entry.path}")
+                    except Exception as e:
+                        logger.debug(f"Failed to physically remove old file {entry.path}: {e}")
+        except OSError as e:
+            logger.debug("Skipping directory during age cleanup: %s", e)
     
     if physical_removed_count > 0:
         logger.info(f"Physically deleted {physical_removed_count} old files from disk.")
@@ -94,26 +105,37 @@ def cleanup_size_limit(session_factory: Callable[..., Any], directory: str | Pat
 
             logger.info(f"Storage ({current_total_bytes} bytes) exceeds limit ({max_bytes} bytes). Initiating size cleanup.")
 
-            # Fetch oldest non-deleted captures, ordered by timestamp
-            captures_to_consider = session.execute(
-                select(Capture).filter(Capture.deleted == False).order_by(Capture.timestamp.asc())
-            ).scalars().all()
-
-            for capture in captures_to_consider:
+            # Stream the oldest non-deleted captures (timestamp is indexed) and stop as soon
+            # as enough has been freed, instead of loading every capture up front
+            ids_to_delete = []
+            files_to_physically_delete = []
+            oldest_first = session.execute(
+                select(Capture.id, Capture.file_path, Capture.size_bytes)
+                .filter(Capture.deleted == False)
+                .order_by(Capture.timestamp.asc())
+                .execution_options(yield_per=_SIZE_CLEANUP_BATCH)
+            )
+            for capture_id, file_path, size_bytes in oldest_first:
                 if current_total_bytes <= max_bytes:
                     break # Stop if we're within limits
                 
-                capture.deleted = True
-                current_total_bytes -= capture.size_bytes
-                removed_count += 1
-                logger.debug(f"Marked capture {capture.file_path} as deleted due to size limit.")
+                ids_to_delete.append(capture_id)
+                files_to_physically_delete.append(Path(file_path))
+                current_total_bytes -= size_bytes
+                logger.debug(f"Marked capture {file_path} as deleted due to size limit.")
+            oldest_first.close()
+
+            for i in range(0, len(ids_to_delete), _SIZE_CLEANUP_BATCH):
+                session.execute(
+                    update(Capture)
+                    .where(Capture.id.in_(ids_to_delete[i:i + _SIZE_CLEANUP_BATCH]))
+                    .values(deleted=True)
+                )
+            removed_count = len(ids_to_delete)
             
             session.commit()
             logger.info(f"Marked {removed_count} records as deleted due to size limit.")
 
-            # Collect file paths of captures that were just marked for deletion
-            files_to_physically_delete = [Path(c.file_path) for c in captures_to_consider if c.deleted]
-
         except Exception as e:
             session.rollback()
             logger.error(f"Failed to mark records as deleted due to size limit: {e}")
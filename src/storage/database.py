@@ -14,6 +14,7 @@ from sqlalchemy import (
     String,
     create_engine,
 )
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, sessionmaker
 
 
@@ -29,6 +30,7 @@ class Capture(Base):
     file_path: Mapped[str] = mapped_column(String(512))
     size_bytes: Mapped[int] = mapped_column(Integer)
     metadata_json: Mapped[Optional[Dict[str, Any]]] = mapped_column(JSON, nullable=True)
+    ocr_item_count: Mapped[int] = mapped_column(Integer, default=0)  # len(metadata_json.ocr_data.items)
     deleted: Mapped[bool] = mapped_column(Boolean, default=False, index=True)
 
 
@@ -63,9 +65,16 @@ class Execution(Base):
     errors_json: Mapped[Optional[Dict[str, Any]]] = mapped_column(JSON, nullable=True)
 
 
-def initialize_database(db_path: str | Path):
-    Path(db_path).parent.mkdir(parents=True, exist_ok=True)
-    engine = create_engine(f"sqlite:///{Path(db_path).as_posix()}", future=True)
+def initialize_database(db_path: str | Path | Engine):
+    # An Engine is used as given, so callers can attach event listeners before the schema
+    # is created on its first connection
+    if isinstance(db_path, Engine):
+        engine = db_path
+    elif str(db_path) == ":memory:":
+        engine = create_engine("sqlite://", future=True)
+    else:
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        engine = create_engine(f"sqlite:///{Path(db_path).as_posix()}", future=True)
     Base.metadata.create_all(engine)
     return sessionmaker(bind=engine, autoflush=False, autocommit=False, future=True)
 
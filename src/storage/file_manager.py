@@ -34,10 +34,22 @@ class FileManager:
             logger.warning("Failed to delete %s: %s", path, e)
 
     def total_size(self, directory: str | Path) -> int:
+        # os.scandir entries carry the file type from readdir, so only regular files are stat'ed
         total = 0
-        for root, _, files in os.walk(directory):
-            for f in files:
-                total += Path(root, f).stat().st_size
+        stack = [os.fspath(directory)]
+        while stack:
+            try:
+                with os.scandir(stack.pop()) as entries:
+                    for entry in entries:
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                stack.append(entry.path)
+                            elif entry.is_file(follow_symlinks=False):
+                                total += entry.stat(follow_symlinks=False).st_size
+                        except FileNotFoundError:
+                            continue  # Removed while scanning
+            except (FileNotFoundError, NotADirectoryError, PermissionError) as e:
+                logger.debug("Skipping directory during size scan: %s", e)
         return total
 
 
@@ -1,15 +1,18 @@
 # src/ui/main_window.py (Updated)
 
+import atexit
+import copy
+import os
 import time
+from contextlib import contextmanager
 import logging
-import pytz
-from datetime import datetime
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Callable, Dict, Any, List, Optional, Set, Tuple
 
 # --- PyQt Imports ---
-from PyQt6.QtCore import Qt, QTimer, QThread, pyqtSignal, QMetaObject, QUrl
-from PyQt6.QtGui import QCloseEvent, QDesktopServices
+from PyQt6.QtCore import Qt, QAbstractListModel, QModelIndex, QObject, QFileSystemWatcher, QRunnable, QThreadPool, QTimer, QThread, pyqtSignal, QMetaObject, QUrl, Q_ARG
+from PyQt6.QtGui import QAction, QCloseEvent, QDesktopServices
 from PyQt6.QtWidgets import (
     QWidget,
     QMainWindow,
@@ -18,9 +21,8 @@ from PyQt6.QtWidgets import (
     QHBoxLayout,
     QPushButton,
     QTabWidget,
-    QListWidget,
-    QListWidgetItem,
-    QTextEdit,
+    QListView,
+    QPlainTextEdit,
     QSpinBox,
     QCheckBox,
     QGroupBox,
@@ -32,7 +34,10 @@ from PyQt6.QtWidgets import (
     QSlider,
 )
 
-from ..utils import human_size, load_json, save_json
+import orjson
+from sqlalchemy import case, delete, select, func, lambda_stmt, literal, null, union_all, update
+
+from ..utils import ensure_dirs, human_size, load_json, save_json
 from ..storage.database import initialize_database, Workflow, Capture, Event
 from ..automation.executor import WorkflowExecutor
 from ..capture.screen_capture import ScreenCapture, ScreenCaptureConfig
@@ -43,39 +48,210 @@ from ..processing.pipeline import ProcessingPipeline
 logger = logging.getLogger(__name__)
 
 
-class RecordingTimerThread(QThread):
-    """Simple thread to update the recording duration in the UI."""
-    status_updated = pyqtSignal(str)
+_TIMELINE_LIMIT = 200 # Increased limit (per source)
+
+
+def _timeline_select(limit: int):
+    """
+    Latest captures and events (deleted ones filtered out), selecting only the
+    columns the timeline shows, merged and sorted by the database.
+    """
+    captures = select(
+        Capture.timestamp.label("ts"),
+        literal("capture").label("source"),
+        Capture.type.label("kind"),
+        Capture.file_path.label("file_path"),
+        literal("N/A").label("app"),
+        # Screen metadata (OCR items) can be large; the timeline only needs its count
+        case((Capture.type == "audio", Capture.metadata_json), else_=null()).label("payload"),
+        Capture.ocr_item_count.label("ocr_items"),
+    ).where(Capture.deleted == False).order_by(Capture.timestamp.desc()).limit(limit).subquery()
+    events = select(
+        Event.timestamp.label("ts"),
+        literal("event").label("source"),
+        Event.event_type.label("kind"),
+        literal("").label("file_path"),
+        Event.application.label("app"),
+        Event.details_json.label("payload"),
+        literal(0).label("ocr_items"),
+    ).where(Event.deleted == False).order_by(Event.timestamp.desc()).limit(limit).subquery()
+    timeline = union_all(select(captures), select(events)).subquery()
+    return select(timeline).order_by(timeline.c.ts.desc())
+
+
+# Built once; SQLAlchemy caches their compiled SQL under the lambdas' code objects
+_TIMELINE_STMT = lambda_stmt(lambda: _timeline_select(_TIMELINE_LIMIT))
+_WORKFLOW_LIST_STMT = lambda_stmt(
+    lambda: select(Workflow.id, Workflow.name, Workflow.last_used).order_by(Workflow.last_used.desc())
+)
+
+
+@contextmanager
+def _bulk_update(widget: QWidget):
+    """Suppresses repaints, signals and re-sorting on a widget while it is bulk-repopulated."""
+    widget.setUpdatesEnabled(False)
+    was_blocked = widget.blockSignals(True)
+    # A sorted tree would re-sort on every inserted item; sort once at the end instead
+    was_sorting = isinstance(widget, QTreeWidget) and widget.isSortingEnabled()
+    if was_sorting:
+        widget.setSortingEnabled(False)
+    try:
+        yield widget
+    finally:
+        if was_sorting:
+            widget.setSortingEnabled(True)
+        widget.blockSignals(was_blocked)
+        widget.setUpdatesEnabled(True)
+
+
+def _scan_dir(path: str) -> Tuple[Dict[str, int], List[str]]:
+    """Sizes of the files directly inside path and its subdirectories, from one os.scandir pass."""
+    files: Dict[str, int] = {}
+    subdirs: List[str] = []
+    with os.scandir(path) as entries:
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    files[entry.name] = entry.stat(follow_symlinks=False).st_size
+            except FileNotFoundError:
+                continue # Removed while scanning
+    return files, subdirs
+
+
+def _snapshot_tree(root: str) -> Dict[str, Dict[str, int]]:
+    """Maps every directory under root (inclusive) to the sizes of the files it directly holds."""
+    snapshot: Dict[str, Dict[str, int]] = {}
+    stack = [root]
+    while stack:
+        path = stack.pop()
+        try:
+            files, subdirs = _scan_dir(path)
+        except (FileNotFoundError, NotADirectoryError, PermissionError) as e:
+            logger.debug(f"Skipping directory during size scan: {e}")
+            continue
+        snapshot[path] = files
+        stack.extend(subdirs)
+    return snapshot
+
+
+class _StorageScanSignals(QObject):
+    finished = pyqtSignal(object)  # Dict[str, Dict[str, int]] snapshot of the data directories
+
+
+class StorageScanTask(QRunnable):
+    """Snapshots the file sizes under the data directories on a QThreadPool worker."""
+
+    def __init__(self, dirs: List[Path]):
+        super().__init__()
+        self.signals = _StorageScanSignals()
+        # Scan each tree once, skipping directories nested inside another one
+        unique = sorted(set(dirs), key=lambda d: len(d.parts))
+        self._dirs = [d for i, d in enumerate(unique) if not any(o in d.parents for o in unique[:i])]
+
+    def run(self):
+        snapshot: Dict[str, Dict[str, int]] = {}
+        for data_dir in self._dirs:
+            logger.debug(f"Calculating size for: {data_dir}")
+            snapshot.update(_snapshot_tree(os.path.normpath(data_dir)))
+        self.signals.finished.emit(snapshot)
+
+
+class _SettingsSaveSignals(QObject):
+    finished = pyqtSignal(object)  # None on success, otherwise the exception raised
+
 
-    def __init__(self):
+class SettingsSaveTask(QRunnable):
+    """Writes a snapshot of the settings to disk on a QThreadPool worker."""
+
+    def __init__(self, path: Path, settings: Dict[str, Any]):
         super().__init__()
-        self._running = False
-        self._start_time = 0.0
+        self.signals = _SettingsSaveSignals()
+        self._path = path
+        self._settings = settings
 
     def run(self):
-        """Periodically emit the elapsed recording time."""
-        self._running = True
-        self._start_time = time.time()
-        while self._running:
-            elapsed = time.time() - self._start_time
-            # Format as HH:MM:SS
-            elapsed_str = time.strftime("%H:%M:%S", time.gmtime(elapsed))
-            status_text = f"Recording... ({elapsed_str})"
-            self.status_updated.emit(status_text)
-            self.msleep(1000) # Sleep for 1 second
-        logger.info("RecordingTimerThread run loop finished.")
-
-    def stop(self):
-        """Stop the timer thread."""
-        logger.debug("RecordingTimerThread stop called.")
-        self._running = False
-        # Wait for the run loop to exit cleanly
-        if not self.wait(1100): # Wait slightly longer than sleep interval
-            logger.warning("Recording timer thread did not stop cleanly.")
-
-    def reset_timer(self):
-        """Reset the start time without stopping the thread."""
-        self._start_time = time.time()
+        try:
+            save_json(self._path, self._settings) # Uses safe save (write tmp then replace)
+        except Exception as e:
+            self.signals.finished.emit(e)
+            return
+        self.signals.finished.emit(None)
+
+
+class WorkflowListModel(QAbstractListModel):
+    """(id, name, last_used) rows for the workflow list; the view only asks for visible rows."""
+    PLACEHOLDER = "No workflows detected yet."
+    NameRole = Qt.ItemDataRole.UserRole + 1 # Bare workflow name, without the last-used suffix
+
+    def __init__(self, parent: Optional[QObject] = None):
+        super().__init__(parent)
+        self._rows: List[Tuple[int, str, Optional[datetime]]] = []
+        # Row text is formatted on first paint and reused; the view re-asks on every repaint
+        self._text_cache: Dict[int, str] = {}
+
+    @staticmethod
+    def display_text(name: str, last_used: Optional[datetime]) -> str:
+        last_used_str = last_used.replace(tzinfo=None).isoformat(sep=' ', timespec='minutes') if last_used else 'Never'
+        return f"{name} (Last used: {last_used_str})"
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return len(self._rows) or 1 # A single placeholder row when empty
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+        if not self._rows:
+            return self.PLACEHOLDER if role == Qt.ItemDataRole.DisplayRole else None
+        workflow_id, name, last_used = self._rows[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            text = self._text_cache.get(workflow_id)
+            if text is None:
+                text = self._text_cache[workflow_id] = self.display_text(name, last_used)
+            return text
+        if role == Qt.ItemDataRole.UserRole:
+            return workflow_id
+        if role == self.NameRole:
+            return name
+        return None
+
+    def set_rows(self, rows) -> None:
+        self.beginResetModel()
+        self._rows = [tuple(row) for row in rows]
+        self._text_cache.clear()
+        self.endResetModel()
+
+    def workflow_ids(self) -> List[int]:
+        return [row[0] for row in self._rows]
+
+    def row_of(self, workflow_id: int) -> int:
+        for i, row in enumerate(self._rows):
+            if row[0] == workflow_id:
+                return i
+        return -1
+
+    def remove_row(self, row: int) -> None:
+        if len(self._rows) == 1:
+            self.set_rows([]) # Swap in the placeholder
+            return
+        self.beginRemoveRows(QModelIndex(), row, row)
+        self._text_cache.pop(self._rows.pop(row)[0], None)
+        self.endRemoveRows()
+
+    def mark_used(self, row: int, last_used: datetime) -> None:
+        """Updates a row's last-used time and moves it to the top, as the list is ordered by last use."""
+        workflow_id, name, _ = self._rows[row]
+        self._rows[row] = (workflow_id, name, last_used)
+        self._text_cache.pop(workflow_id, None)
+        if row > 0 and self.beginMoveRows(QModelIndex(), row, row, QModelIndex(), 0):
+            self._rows.insert(0, self._rows.pop(row))
+            self.endMoveRows()
+            row = 0
+        index = self.index(row)
+        self.dataChanged.emit(index, index, [Qt.ItemDataRole.DisplayRole])
 
 
 class MainWindow(QMainWindow):
@@ -83,14 +259,28 @@ class MainWindow(QMainWindow):
     recording_started = pyqtSignal()
     recording_stopped = pyqtSignal()
 
+    # Status label style sheets, applied only when the status state changes
+    _SS_RECORDING = "font-weight: bold; color: red;"
+    _SS_PROCESSING = "font-weight: bold; color: orange;"
+    _SS_IDLE = "font-weight: bold; color: green;"
+
     def __init__(self, settings: Dict[str, Any], project_root: Path):
         super().__init__()
         self.settings = settings
         self.project_root = project_root
+        self._settings_path = project_root / "config/settings.json"
+        # Run workflows on a dedicated thread so long executions never block the UI
         self.workflow_executor = WorkflowExecutor()
+        self.executor_thread = QThread()
+        self.workflow_executor.moveToThread(self.executor_thread)
+        self.executor_thread.start()
 
-        self.timer_thread = RecordingTimerThread()
-        self.timer_thread.status_updated.connect(self.update_status)
+        # Recording clock: a GUI-thread timer reading time.monotonic() on each tick
+        self._rec_start = 0.0
+        self._rec_timer = QTimer(self)
+        self._rec_timer.setTimerType(Qt.TimerType.CoarseTimer)
+        self._rec_timer.setInterval(1000)
+        self._rec_timer.timeout.connect(self._on_rec_tick)
 
         # Initialize background processing pipeline
         self.processing_pipeline: Optional[ProcessingPipeline] = None
@@ -110,13 +300,65 @@ class MainWindow(QMainWindow):
         self.setMinimumSize(1000, 700)
 
         # Initialize database connection factory
-        db_path_str = settings.get("storage", {}).get("database_path", "data/app.db")
+        stor_settings = settings.get("storage", {})
+        db_path_str = stor_settings.get("database_path", "data/app.db")
         self.db_path = project_root / db_path_str
-        self.session_factory = initialize_database(self.db_path)
+
+        # Resolve the data directories once; they are used by every stats refresh
+        self._screens_dir = (project_root / stor_settings.get("screens_dir", "data/screens")).resolve()
+        self._audio_dir = (project_root / stor_settings.get("audio_dir", "data/audio")).resolve()
+        self._db_dir = self.db_path.parent.resolve()
+
+        # Opened on first use, so creating the schema does not delay the first paint
+        self._session_factory: Optional[Callable[[], Any]] = None
+        # Storage usage is seeded by one background scan, then kept current by watching
+        # the data directories and re-reading only the ones that change
+        self._storage_bytes: Optional[int] = None
+        self._dir_snapshot: Dict[str, Dict[str, int]] = {}
+        self._dirty_dirs: Set[str] = set()
+        self._fs_watcher = QFileSystemWatcher(self)
+        self._fs_watcher.directoryChanged.connect(self._on_data_dir_changed)
+        self._fs_watcher.fileChanged.connect(lambda path: self._on_data_dir_changed(os.path.dirname(path)))
+        self._storage_rescan_timer = QTimer(self)
+        self._storage_rescan_timer.setSingleShot(True)
+        self._storage_rescan_timer.setInterval(1000) # Coalesce bursts of file writes
+        self._storage_rescan_timer.timeout.connect(self._rescan_dirty_dirs)
+        self._storage_scan_signals: Optional[_StorageScanSignals] = None
+        self._reconcile_storage_usage()
+        # Periodic full rescan (off the GUI thread) catches what the watcher cannot see,
+        # such as files growing in place
+        self._storage_reconcile_timer = QTimer(self)
+        self._storage_reconcile_timer.setTimerType(Qt.TimerType.VeryCoarseTimer)
+        self._storage_reconcile_timer.timeout.connect(self._reconcile_storage_usage)
+        self._storage_reconcile_timer.start(5 * 60 * 1000)
+
+        # In-memory workflow count for the dashboard, reconciled with the DB every minute
+        self._wf_count: Optional[int] = None
+        QTimer.singleShot(0, self._open_database) # Once the event loop (and window) is up
+        self._wf_count_timer = QTimer(self)
+        self._wf_count_timer.setTimerType(Qt.TimerType.VeryCoarseTimer)
+        self._wf_count_timer.timeout.connect(self._reconcile_workflow_count)
+        self._wf_count_timer.start(60000)
+
+        # Workflows currently listed, and their pattern_json filled in lazily
+        self._wf_model = WorkflowListModel(self)
+        self._workflow_cache: Dict[int, Optional[Dict[str, Any]]] = {}
+        self._details_cache: Dict[int, str] = {} # Formatted pattern JSON per workflow id
+
+        # Start/stop actions shared by the dashboard buttons and the tray menu, so one
+        # setEnabled keeps every entry point in sync
+        self.start_action = QAction("Start Recording", self)
+        self.start_action.triggered.connect(self.start_recording)
+        self.stop_action = QAction("Stop Recording", self)
+        self.stop_action.triggered.connect(self.stop_recording)
+        self.stop_action.setEnabled(False)
 
         self._init_ui()
         self._load_workflows() # Load initial workflows into the UI
 
+        # Safety net so capture QThreads are not left running at interpreter shutdown
+        atexit.register(self._stop_recording_at_exit)
+
     def _initialize_processing_pipeline(self):
         """Initialize the processing pipeline and its thread."""
         try:
@@ -124,7 +366,12 @@ class MainWindow(QMainWindow):
             self.processing_thread = QThread()
             self.processing_pipeline.moveToThread(self.processing_thread)
             # Connect signal for newly detected workflows from pipeline to UI handler
-            self.processing_pipeline.workflow_detected.connect(self.handle_workflow_detected)
+            self.processing_pipeline.workflow_detected.connect(
+                self.handle_workflow_detected, Qt.ConnectionType.QueuedConnection
+            )
+            self.processing_pipeline.backlog_warning.connect(
+                self.handle_backlog_warning, Qt.ConnectionType.QueuedConnection
+            )
             # Start the thread. The pipeline itself waits for a start signal.
             self.processing_thread.start()
             logger.info("Processing pipeline thread started at launch. Models are loading.")
@@ -137,27 +384,62 @@ class MainWindow(QMainWindow):
     def _init_ui(self) -> None:
         """Initialize the main user interface components and tabs."""
         self.tabs = QTabWidget()
-        self.tabs.addTab(self._dashboard_tab(), "Dashboard")
-        self.tabs.addTab(self._workflows_tab(), "Workflows")
-        self.tabs.addTab(self._timeline_tab(), "Timeline")
-        self.tabs.addTab(self._automation_tab(), "Automation")
-        self.tabs.addTab(self._settings_tab(), "Settings")
+        # Lower-cased tab name -> index, for constant-time tab switching
+        self._tab_index: Dict[str, int] = {}
+        # Tabs start as empty containers and are filled in on first visit
+        self._tab_builders: Dict[int, Callable[[], QWidget]] = {}
+        self._built_tabs: Set[int] = set()
+        for name, builder in (
+            ("Dashboard", self._dashboard_tab),
+            ("Workflows", self._workflows_tab),
+            ("Timeline", self._timeline_tab),
+            ("Automation", self._automation_tab),
+            ("Settings", self._settings_tab),
+        ):
+            container = QWidget()
+            QVBoxLayout(container).setContentsMargins(0, 0, 0, 0)
+            index = self.tabs.addTab(container, name)
+            self._tab_index[name.lower()] = index
+            self._tab_builders[index] = builder
+        self._ensure_tab_built(self._tab_index["dashboard"])
         self.setCentralWidget(self.tabs)
 
+        # Debounce tab-driven refreshes so flicking through tabs costs one DB round-trip
+        self._pending_tab: Optional[str] = None
+        self._tab_refresh_timer = QTimer(self)
+        self._tab_refresh_timer.setSingleShot(True)
+        self._tab_refresh_timer.setInterval(150)
+        self._tab_refresh_timer.timeout.connect(self._do_tab_refresh)
+
+        # Coalesce bursts of workflow detections into a single list rebuild
+        self._wf_reload_timer = QTimer(self)
+        self._wf_reload_timer.setSingleShot(True)
+        self._wf_reload_timer.setInterval(250)
+        self._wf_reload_timer.timeout.connect(self._load_workflows)
+
+        # Coalesce rapid re-saves into one settings write, done off the GUI thread
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(500)
+        self._save_timer.timeout.connect(self._flush_settings)
+        self._settings_save_signals: Optional[_SettingsSaveSignals] = None
+
         # Connect signals for UI interactions
-        self.workflow_list.currentItemChanged.connect(self.display_workflow_details)
         self.tabs.currentChanged.connect(self._handle_tab_change)
 
+    def _ensure_tab_built(self, index: int) -> None:
+        """Builds a tab's widgets into its container the first time it is needed."""
+        if index in self._built_tabs:
+            return
+        self._built_tabs.add(index)
+        self.tabs.widget(index).layout().addWidget(self._tab_builders[index]())
+
+    def _is_tab_built(self, name: str) -> bool:
+        return self._tab_index[name] in self._built_tabs
+
     def show_settings_tab(self):
         """Switch to the Settings tab and ensure the window is visible."""
-        settings_index = -1
-        for i in range(self.tabs.count()):
-            if self.tabs.tabText(i).lower() == "settings":
-                settings_index = i
-                break
-        
-        if settings_index != -1:
-            self.tabs.setCurrentIndex(settings_index)
+        self.tabs.setCurrentIndex(self._tab_index["settings"])
 
         # Ensure window is visible, raised, and active
         self.show()
@@ -176,15 +458,16 @@ class MainWindow(QMainWindow):
         status_layout = QVBoxLayout(status_group)
         
         self.status_label = QLabel("Status: Idle")
-        self.status_label.setStyleSheet("font-weight: bold; color: green;")
+        self.status_label.setStyleSheet(self._SS_IDLE)
+        self._status_ss = self._SS_IDLE
         
         button_layout = QHBoxLayout()
-        self.start_btn = QPushButton("Start Recording")
-        self.stop_btn = QPushButton("Stop Recording")
-        self.stop_btn.setEnabled(False)
-        
-        self.start_btn.clicked.connect(self.start_recording)
-        self.stop_btn.clicked.connect(self.stop_recording)
+        self.start_btn = QPushButton(self.start_action.text())
+        self.stop_btn = QPushButton(self.stop_action.text())
+        for button, action in ((self.start_btn, self.start_action), (self.stop_btn, self.stop_action)):
+            button.setEnabled(action.isEnabled())
+            button.clicked.connect(action.trigger)
+            action.enabledChanged.connect(button.setEnabled)
         
         button_layout.addWidget(self.start_btn)
         button_layout.addWidget(self.stop_btn)
@@ -196,7 +479,7 @@ class MainWindow(QMainWindow):
         stats_group = QGroupBox("Statistics")
         stats_layout = QVBoxLayout(stats_group)
         self.storage_label = QLabel("Storage usage: Calculating...")
-        self.workflows_label = QLabel("Learned workflows: 0")
+        self.workflows_label = QLabel("Learned workflows: Loading...")
         self.captures_label = QLabel("Total captures: 0") # TODO: Implement capture count query
         open_data_dir_btn = QPushButton("Open Data Directory")
         open_data_dir_btn.clicked.connect(self.open_data_directory)
@@ -210,6 +493,7 @@ class MainWindow(QMainWindow):
         progress_layout = QVBoxLayout(progress_group)
         
         self.progress_bar = QProgressBar()
+        self._progress_visible: Optional[bool] = None # Unknown until the first update_status
         self.progress_label = QLabel("Ready")
         
         progress_layout.addWidget(self.progress_label)
@@ -221,7 +505,9 @@ class MainWindow(QMainWindow):
         layout.addStretch(1)
         
         # Update stats periodically
-        self.stats_timer = QTimer()
+        self.stats_timer = QTimer(self)
+        # Second-granularity timer: the OS can batch its wake-ups with other timers
+        self.stats_timer.setTimerType(Qt.TimerType.VeryCoarseTimer)
         self.stats_timer.timeout.connect(self.update_stats)
         self.stats_timer.start(5000)  # Update every 5 seconds
         
@@ -237,7 +523,14 @@ class MainWindow(QMainWindow):
         left_layout = QVBoxLayout(left_panel)
         
         left_layout.addWidget(QLabel("Detected Workflows:"))
-        self.workflow_list = QListWidget()
+        self.workflow_list = QListView()
+        self.workflow_list.setModel(self._wf_model)
+        self.workflow_list.setUniformItemSizes(True) # Single-line rows; skips per-row size hints
+        self.workflow_list.selectionModel().currentChanged.connect(self.display_workflow_details)
+        self._details_timer = QTimer(self)
+        self._details_timer.setSingleShot(True)
+        self._details_timer.setInterval(150)
+        self._details_timer.timeout.connect(self._render_workflow_details)
         left_layout.addWidget(self.workflow_list)
         workflow_buttons = QHBoxLayout()
         self.edit_workflow_btn = QPushButton("Edit (Not Implemented)")
@@ -255,7 +548,7 @@ class MainWindow(QMainWindow):
         right_layout = QVBoxLayout(right_panel)
         
         right_layout.addWidget(QLabel("Workflow Details:"))
-        self.workflow_details = QTextEdit()
+        self.workflow_details = QPlainTextEdit()
         self.workflow_details.setReadOnly(True)
         right_layout.addWidget(self.workflow_details)
 
@@ -271,6 +564,7 @@ class MainWindow(QMainWindow):
 
         self.timeline_tree = QTreeWidget()
         self.timeline_tree.setHeaderLabels(["Time (UTC)", "Type", "Details", "App"])
+        self.timeline_tree.setUniformRowHeights(True) # Single-line rows; skips per-row size hints
         self.timeline_tree.setColumnWidth(0, 180)
         self.timeline_tree.setColumnWidth(1, 100) # Wider type column
         self.timeline_tree.setColumnWidth(2, 400)
@@ -313,9 +607,7 @@ class MainWindow(QMainWindow):
         confidence_layout.addWidget(QLabel("Confidence Threshold:"))
         confidence_layout.addWidget(self.auto_confidence_slider)
         self.confidence_label = QLabel("80%")
-        self.auto_confidence_slider.valueChanged.connect(
-            lambda v: self.confidence_label.setText(f"{v}%")
-        )
+        self.auto_confidence_slider.valueChanged.connect(self._on_confidence_changed)
         confidence_layout.addWidget(self.confidence_label)
         controls_layout.addWidget(self.auto_enabled_checkbox)
         controls_layout.addLayout(confidence_layout)
@@ -324,8 +616,9 @@ class MainWindow(QMainWindow):
         log_group = QGroupBox("Automation Log")
         log_layout = QVBoxLayout(log_group)
         
-        self.automation_log = QTextEdit()
+        self.automation_log = QPlainTextEdit()
         self.automation_log.setReadOnly(True)
+        self.automation_log.setMaximumBlockCount(5000) # Oldest lines are evicted in long sessions
         log_layout.addWidget(self.automation_log)
 
         layout.addWidget(controls_group)
@@ -334,6 +627,9 @@ class MainWindow(QMainWindow):
 
         return root
 
+    def _on_confidence_changed(self, value: int):
+        self.confidence_label.setText(f"{value}%")
+
     def _settings_tab(self) -> QWidget:
         """Create the Settings tab UI."""
         root = QWidget()
@@ -369,10 +665,17 @@ class MainWindow(QMainWindow):
         privacy_group = QGroupBox("Privacy Settings")
         privacy_layout = QVBoxLayout(privacy_group)
         
-        self.exclude_apps_text = QTextEdit()
+        self.exclude_apps_text = QPlainTextEdit()
         self.exclude_apps_text.setMaximumHeight(100)
         excluded = self.settings.get("privacy", {}).get("exclude_apps", [])
         self.exclude_apps_text.setPlainText("\n".join(excluded))
+        # Parsed while the user types (debounced), so saving only serializes the list
+        self._excluded_apps: List[str] = list(excluded)
+        self._exclude_apps_timer = QTimer(self)
+        self._exclude_apps_timer.setSingleShot(True)
+        self._exclude_apps_timer.setInterval(300)
+        self._exclude_apps_timer.timeout.connect(self._parse_excluded_apps)
+        self.exclude_apps_text.textChanged.connect(self._exclude_apps_timer.start)
         
         privacy_layout.addWidget(QLabel("Excluded Applications (one per line):"))
         privacy_layout.addWidget(self.exclude_apps_text)
@@ -404,8 +707,14 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, "Open Directory", f"Could not automatically open the data directory:\n{data_dir}\nPlease navigate there manually.")
 
     def _handle_tab_change(self, index):
-        """Refreshes data when specific tabs are selected."""
-        tab_text = self.tabs.tabText(index)
+        """Builds the tab on first visit and schedules a (debounced) data refresh."""
+        self._ensure_tab_built(index)
+        self._pending_tab = self.tabs.tabText(index)
+        self._tab_refresh_timer.start() # Restarts the interval on every change
+
+    def _do_tab_refresh(self):
+        """Refreshes data for the tab that was selected last."""
+        tab_text, self._pending_tab = self._pending_tab, None
         if tab_text == "Timeline":
             logger.debug("Timeline tab selected, refreshing data.")
             self.refresh_timeline()
@@ -418,14 +727,13 @@ class MainWindow(QMainWindow):
     def start_recording(self):
         """Starts screen, audio, and event capture threads."""
         logger.info("Start recording requested.")
-        if self.stop_btn.isEnabled(): # Prevent double start
+        if self.stop_action.isEnabled(): # Prevent double start
              logger.warning("Recording is already active.")
              return
         try:
             # Load current settings
             cap_settings = self.settings.get("capture", {})
             aud_settings = self.settings.get("audio", {})
-            stor_settings = self.settings.get("storage", {})
 
             # Create Config objects
             screen_config = ScreenCaptureConfig(
@@ -447,73 +755,84 @@ class MainWindow(QMainWindow):
                 device=aud_settings.get("device", None),
             )
             event_config = EventTrackerConfig(
-                log_path=self.project_root / "data/logs/events.jsonl"
+                log_path=self.project_root / "data/logs/events.jsonl",
+                exclude_apps=self.settings.get("privacy", {}).get("exclude_apps", []),
             )
 
             # Define and ensure output directories exist
-            screens_dir = self.project_root / stor_settings.get("screens_dir", "data/screens")
-            audio_dir = self.project_root / stor_settings.get("audio_dir", "data/audio")
+            screens_dir = self._screens_dir
+            audio_dir = self._audio_dir
             log_dir = self.project_root / "data/logs"
             screens_dir.mkdir(parents=True, exist_ok=True)
             audio_dir.mkdir(parents=True, exist_ok=True)
             log_dir.mkdir(parents=True, exist_ok=True)
 
-            # Create Capture Objects
+            # Connect Signals to Processing Pipeline
+            if not self.processing_pipeline:
+                logger.error("Processing pipeline is not initialized. Cannot connect signals.")
+                self._initialize_processing_pipeline() # Attempt re-initialization
+                if not self.processing_pipeline:
+                    raise Exception("Processing pipeline failed to initialize.")
+
+            # Create Capture Objects and their Threads
             self.screen_capture = ScreenCapture(screens_dir, screen_config)
             self.audio_capture = AudioCapture(audio_dir, audio_config)
             self.event_tracker = EventTracker(event_config)
-
-            # Create and Start Threads
             self.screen_thread = QThread()
-            self.screen_capture.moveToThread(self.screen_thread)
-            self.screen_thread.started.connect(self.screen_capture.start)
-            logger.info("Starting screen capture thread...")
-            self.screen_thread.start()
-
             self.audio_thread = QThread()
-            self.audio_capture.moveToThread(self.audio_thread)
-            self.audio_thread.started.connect(self.audio_capture.start)
-            logger.info("Starting audio capture thread...")
-            self.audio_thread.start()
-
             self.event_thread = QThread()
-            self.event_tracker.moveToThread(self.event_thread)
-            self.event_thread.started.connect(self.event_tracker.start)
-            logger.info("Starting event tracker thread...")
-            self.event_thread.start()
+            captures = (
+                (self.screen_capture, self.screen_thread),
+                (self.audio_capture, self.audio_thread),
+                (self.event_tracker, self.event_thread),
+            )
 
-            # Connect Signals to Processing Pipeline
-            if not self.processing_pipeline:
-                logger.error("Processing pipeline is not initialized. Cannot connect signals.")
-                self._initialize_processing_pipeline() # Attempt re-initialization
-                if not self.processing_pipeline:
-                    raise Exception("Processing pipeline failed to initialize.")
+            # Settle thread affinity before anything is connected or started
+            for obj, thread in captures:
+                obj.moveToThread(thread)
 
-            # Ensure signals are connected (re-connect just in case)
-            try: self.audio_capture.audio_file_ready.disconnect()
-            except TypeError: pass
-            try: self.screen_capture.video_file_ready.disconnect()
-            except TypeError: pass
-            self.audio_capture.audio_file_ready.connect(self.processing_pipeline.process_audio)
-            self.screen_capture.video_file_ready.connect(self.processing_pipeline.process_video)
+            # The enqueue slots only push onto the pipeline's bounded, thread-safe backlog,
+            # so they run directly in the capture thread rather than growing the pipeline
+            # thread's Qt event queue.
+            self.audio_capture.audio_file_ready.connect(
+                self.processing_pipeline.enqueue_audio, Qt.ConnectionType.DirectConnection
+            )
+            self.screen_capture.video_file_ready.connect(
+                self.processing_pipeline.enqueue_video, Qt.ConnectionType.DirectConnection
+            )
             logger.info("Connected capture signals to processing pipeline.")
+            # New files are counted as they are written, on the GUI thread
+            self.audio_capture.file_written.connect(
+                self._on_capture_file_written, Qt.ConnectionType.QueuedConnection
+            )
+            self.screen_capture.file_written.connect(
+                self._on_capture_file_written, Qt.ConnectionType.QueuedConnection
+            )
+            for obj, thread in captures:
+                thread.started.connect(obj.start)
+                # Deferred deletes are only delivered while a thread still runs its loop, so
+                # they must be queued from finished rather than after wait() has returned
+                thread.finished.connect(obj.deleteLater)
+                thread.finished.connect(thread.deleteLater)
+
+            # Start all capture threads in one pass, once everything is wired
+            logger.info("Starting screen, audio and event capture threads...")
+            for _, thread in captures:
+                thread.start()
 
             # Start Processing Pipeline Analysis Timer
             QMetaObject.invokeMethod(self.processing_pipeline, "start", Qt.ConnectionType.QueuedConnection)
             logger.info("Signaled processing pipeline to start its analysis timer.")
 
             # Update UI State and Start UI Timer
-            self.start_btn.setEnabled(False)
-            self.stop_btn.setEnabled(True)
+            self.start_action.setEnabled(False)
+            self.stop_action.setEnabled(True)
             self.recording_started.emit() # For tray icon state
 
-            if not self.timer_thread.isRunning():
-                logger.info("Starting UI timer thread...")
-                self.timer_thread.start()
-            else:
-                self.timer_thread.reset_timer()
-
             self.update_status("Starting...")
+            self._rec_start = time.monotonic()
+            self._rec_timer.start()
+            self._on_rec_tick()
 
         except Exception as e:
             logger.exception("Failed to start recording: %s", e)
@@ -523,17 +842,14 @@ class MainWindow(QMainWindow):
     def stop_recording(self):
         """Stops all capture threads and the processing timer."""
         logger.info("Stop recording requested.")
-        if not self.stop_btn.isEnabled(): # Prevent double stop
+        if not self.stop_action.isEnabled(): # Prevent double stop
              logger.warning("Recording is not currently active.")
              return
 
         self.update_status("Stopping...") # Update UI immediately
 
         # Stop UI Timer First
-        if self.timer_thread.isRunning():
-            logger.debug("Stopping RecordingTimerThread...")
-            self.timer_thread.stop()
-            logger.debug("RecordingTimerThread finished.")
+        self._rec_timer.stop()
 
         # Flag to track shutdown status
         capture_stopped_cleanly = True
@@ -548,8 +864,9 @@ class MainWindow(QMainWindow):
             self.screen_capture.stop()
         if self.screen_thread and self.screen_thread.isRunning():
             logger.debug("Quitting screen_thread...")
+            self.screen_thread.requestInterruption()
             self.screen_thread.quit()
-            threads_to_wait.append(("Screen", self.screen_thread))
+            threads_to_wait.append(("Screen", self.screen_thread, self.screen_capture))
         self.screen_capture = None # Clear reference early
 
         # Audio Capture
@@ -558,8 +875,9 @@ class MainWindow(QMainWindow):
             self.audio_capture.stop()
         if self.audio_thread and self.audio_thread.isRunning():
             logger.debug("Quitting audio_thread...")
+            self.audio_thread.requestInterruption()
             self.audio_thread.quit()
-            threads_to_wait.append(("Audio", self.audio_thread))
+            threads_to_wait.append(("Audio", self.audio_thread, self.audio_capture))
         self.audio_capture = None
 
         # Event Tracker
@@ -568,18 +886,21 @@ class MainWindow(QMainWindow):
             self.event_tracker.stop() # Stops pynput listeners
         if self.event_thread and self.event_thread.isRunning():
             logger.debug("Quitting event_thread...")
+            self.event_thread.requestInterruption()
             self.event_thread.quit()
-            threads_to_wait.append(("Event", self.event_thread))
+            threads_to_wait.append(("Event", self.event_thread, self.event_tracker))
         self.event_tracker = None
 
-        # Wait for threads to finish
-        wait_timeout_ms = 3000 # 3 seconds per thread type
-        for name, thread in threads_to_wait:
-            if not thread.wait(wait_timeout_ms):
+        # All threads are already stopping, so wait for them against one shared deadline
+        deadline = time.monotonic() + 3.0
+        for name, thread, capture in threads_to_wait:
+            remaining_ms = max(0, int((deadline - time.monotonic()) * 1000))
+            if not thread.wait(remaining_ms):
                 logger.warning(f"{name} capture thread did not finish cleanly.")
                 capture_stopped_cleanly = False
             else:
                 logger.info(f"{name} capture thread stopped.")
+                self._release_capture(capture)
         # Clear thread references after waiting
         self.screen_thread = None
         self.audio_thread = None
@@ -595,153 +916,311 @@ class MainWindow(QMainWindow):
             logger.warning("Processing pipeline not found during stop.")
 
         # Final UI Update
-        self.start_btn.setEnabled(True)
-        self.stop_btn.setEnabled(False)
+        self.start_action.setEnabled(True)
+        self.stop_action.setEnabled(False)
         final_status = "Stopped recording" if capture_stopped_cleanly else "Stopped recording (Warning: Some threads timed out)"
         self.update_status(final_status)
         self.recording_stopped.emit() # For tray icon state
         logger.info(f"Stop recording sequence finished. Final status: {final_status}")
 
 
+    def _release_capture(self, capture: Optional[QObject]) -> None:
+        """Disconnects a stopped capture object; its thread's finished signal deletes both."""
+        if capture is None:
+            return
+        for signal_name in ("video_file_ready", "audio_file_ready", "file_written"):
+            signal = getattr(capture, signal_name, None)
+            if signal is None:
+                continue
+            try: signal.disconnect()
+            except TypeError: pass
+
+    def _stop_recording_at_exit(self):
+        """atexit hook: stops recording if it is still active when the interpreter shuts down."""
+        try:
+            if self.stop_action.isEnabled():
+                logger.info("Recording still active at interpreter exit, stopping capture threads...")
+                self.stop_recording()
+        except RuntimeError:
+            # Underlying Qt objects may already be gone during interpreter teardown
+            pass
+
     # --- UI Updates ---
 
     def update_status(self, status: str):
         """Update status labels and progress bar based on recording state."""
-        self.status_label.setText(f"Status: {status}")
-        self.progress_label.setText(f"Status: {status}")
+        text = f"Status: {status}"
+        if text != self.status_label.text():
+            self.status_label.setText(text)
+        if text != self.progress_label.text():
+            self.progress_label.setText(text)
         is_recording = "Recording" in status
         is_processing = "Stopping" in status or "Starting" in status # Could refine this
 
         if is_recording:
-            self.status_label.setStyleSheet("font-weight: bold; color: red;")
-            self.progress_bar.setVisible(True)
+            style_sheet, progress_visible = self._SS_RECORDING, True
         elif is_processing:
-            self.status_label.setStyleSheet("font-weight: bold; color: orange;")
-            self.progress_bar.setVisible(True)
+            style_sheet, progress_visible = self._SS_PROCESSING, True
         else: # Idle or Stopped
-            self.status_label.setStyleSheet("font-weight: bold; color: green;")
-            self.progress_bar.setVisible(False)
+            style_sheet, progress_visible = self._SS_IDLE, False
+
+        # Re-polishing a style sheet is expensive, so only touch it on state transitions
+        if style_sheet != self._status_ss:
+            self.status_label.setStyleSheet(style_sheet)
+            self._status_ss = style_sheet
+        if progress_visible != self._progress_visible:
+            self.progress_bar.setVisible(progress_visible)
+            self._progress_visible = progress_visible
+
+    def _on_rec_tick(self):
+        """Format the elapsed recording time (HH:MM:SS) and show it as the status."""
+        hours, rem = divmod(int(time.monotonic() - self._rec_start), 3600)
+        minutes, seconds = divmod(rem, 60)
+        self.update_status(f"Recording... ({hours:02d}:{minutes:02d}:{seconds:02d})")
+
+    def _reconcile_storage_usage(self):
+        """
+        Walks the data directories on a worker thread to seed the storage counter and
+        the per-directory size snapshot that the file system watcher keeps up to date.
+        """
+        if self._storage_scan_signals is not None:
+            logger.debug("Storage scan already in flight; skipping.")
+            return
+        ensure_dirs(self._screens_dir, self._audio_dir) # Watch them before the first recording
+        task = StorageScanTask([self._screens_dir, self._audio_dir, self._db_dir]) # Include DB directory
+        task.signals.finished.connect(self._apply_storage_scan)
+        self._storage_scan_signals = task.signals # Keep the emitter alive until it reports
+        QThreadPool.globalInstance().start(task)
+
+    def _apply_storage_scan(self, snapshot: Dict[str, Dict[str, int]]):
+        """Receives the background scan result on the GUI thread and starts watching."""
+        self._storage_scan_signals = None
+        watched = self._fs_watcher.directories() + self._fs_watcher.files()
+        if watched:
+            self._fs_watcher.removePaths(watched)
+        self._dir_snapshot = {}
+        self._storage_bytes = 0
+        self._track_tree(snapshot)
+        if self.db_path.exists():
+            self._fs_watcher.addPath(str(self.db_path)) # The DB grows in place, no dir event
+        logger.debug(f"Storage usage seeded: {self._storage_bytes} bytes in {len(snapshot)} directories")
+        self.update_stats()
+
+    def _track_tree(self, snapshot: Dict[str, Dict[str, int]]):
+        """Adds newly scanned directories to the counter and the watcher."""
+        for path, files in snapshot.items():
+            self._dir_snapshot[path] = files
+            self._storage_bytes += sum(files.values())
+        if snapshot:
+            self._fs_watcher.addPaths(list(snapshot))
+
+    def _drop_tree(self, root: str):
+        """Forgets a removed directory and everything below it."""
+        prefix = root + os.sep
+        for path in [p for p in self._dir_snapshot if p == root or p.startswith(prefix)]:
+            self._storage_bytes -= sum(self._dir_snapshot.pop(path).values())
+            if path in self._fs_watcher.directories():
+                self._fs_watcher.removePath(path)
+
+    def _on_capture_file_written(self, path: str, size: int):
+        """Counts a freshly written capture file at once, ahead of the watcher's rescan."""
+        if self._storage_bytes is None:
+            return # The seed scan has not reported yet and will include the file
+        directory, name = os.path.split(os.path.normpath(path))
+        files = self._dir_snapshot.get(directory)
+        if files is None:
+            return # Not a tracked directory; the watcher picks it up
+        self._storage_bytes += size - files.get(name, 0)
+        files[name] = size
+
+    def _on_data_dir_changed(self, path: str):
+        self._dirty_dirs.add(os.path.normpath(path))
+        self._storage_rescan_timer.start()
+
+    def _rescan_dirty_dirs(self):
+        """Re-reads only the directories that changed and applies the size delta."""
+        dirty, self._dirty_dirs = self._dirty_dirs, set()
+        for path in dirty:
+            old_files = self._dir_snapshot.get(path)
+            if old_files is None:
+                continue # Not tracked (already dropped)
+            try:
+                files, subdirs = _scan_dir(path)
+            except (FileNotFoundError, NotADirectoryError, PermissionError):
+                self._drop_tree(path)
+                continue
+            self._storage_bytes += sum(files.values()) - sum(old_files.values())
+            self._dir_snapshot[path] = files
+            for sub in subdirs:
+                if sub not in self._dir_snapshot:
+                    self._track_tree(_snapshot_tree(sub))
+            current = set(subdirs)
+            for gone in [p for p in self._dir_snapshot if os.path.dirname(p) == path and p != path and p not in current]:
+                self._drop_tree(gone)
 
     def update_stats(self):
         """Update dashboard statistics like storage usage and workflow count."""
-        # Calculate storage size
-        try:
-            total_size = 0
-            data_dirs = [
-                self.project_root / self.settings.get("storage", {}).get("screens_dir", "data/screens"),
-                self.project_root / self.settings.get("storage", {}).get("audio_dir", "data/audio"),
-                self.db_path.parent # Include DB directory
-            ]
-            checked_paths = set()
-            for data_dir in data_dirs:
-                resolved_dir = data_dir.resolve()
-                if resolved_dir not in checked_paths and resolved_dir.exists():
-                    logger.debug(f"Calculating size for: {resolved_dir}")
-                    for path in resolved_dir.rglob("*"):
-                        if path.is_file():
-                            try: total_size += path.stat().st_size
-                            except FileNotFoundError: continue
-                    checked_paths.add(resolved_dir)
-            self.storage_label.setText(f"Storage usage: {human_size(total_size)}")
-        except Exception as e:
-            logger.warning("Could not calculate storage size: %s", e)
-            self.storage_label.setText("Storage usage: Error")
+        # Storage size is maintained incrementally from capture and file system notifications
+        if self._storage_bytes is not None:
+            self.storage_label.setText(f"Storage usage: {human_size(max(0, self._storage_bytes))}")
 
-        # Update workflow count (query DB for accuracy)
+        # Workflow count is tracked in memory and reconciled with the DB periodically
+        if self._wf_count is not None:
+            self.workflows_label.setText(f"Learned workflows: {self._wf_count}")
+        elif self._session_factory is not None: # Otherwise the DB is not open yet
+            self.workflows_label.setText("Learned workflows: Error")
+
+        # TODO: Implement capture count update (requires querying DB Capture table)
+
+    @property
+    def session_factory(self) -> Callable[[], Any]:
+        """Session factory for the app database, initialized on first access."""
+        if self._session_factory is None:
+            self._session_factory = initialize_database(self.db_path)
+        return self._session_factory
+
+    def _open_database(self):
+        """Opens the database after startup and seeds the dashboard's workflow count."""
+        self._reconcile_workflow_count()
+        self.update_stats()
+
+    @contextmanager
+    def _session_scope(self):
+        """Yields a session for one UI action; rolled back on error and always closed."""
         session = self.session_factory()
         try:
-            workflow_count = session.query(Workflow).count()
-            self.workflows_label.setText(f"Learned workflows: {workflow_count}")
-        except Exception as e:
-             logger.warning(f"Could not query workflow count: {e}")
-             self.workflows_label.setText("Learned workflows: Error")
+            yield session
+        except Exception:
+            session.rollback()
+            raise
         finally:
-             session.close()
+            session.close()
 
-        # TODO: Implement capture count update (requires querying DB Capture table)
+    def _reconcile_workflow_count(self):
+        """Re-reads the workflow count from the DB to correct the in-memory counter."""
+        try:
+            with self._session_scope() as session:
+                self._wf_count = session.execute(select(func.count(Workflow.id))).scalar_one()
+        except Exception as e:
+            logger.warning(f"Could not query workflow count: {e}")
+            self._wf_count = None
 
     def handle_workflow_detected(self, workflow_data: dict):
         """Handles the signal emitted when the processing pipeline detects a new workflow."""
         summary = workflow_data.get('workflow_summary', 'Unnamed Workflow')
         logger.info(f"UI Received workflow detected signal: {summary}")
-        self._load_workflows() # Reload list to show the new/updated workflow
+        # May be an update of an existing workflow; the periodic reconcile corrects that
+        if self._wf_count is not None:
+            self._wf_count += 1
+        self._wf_reload_timer.start() # Coalesced reload to show the new/updated workflow
 
         # Handle automatic execution if enabled
-        if self.auto_enabled_checkbox.isChecked():
+        # Automation is off until its tab has been built and the checkbox ticked
+        if self._is_tab_built("automation") and self.auto_enabled_checkbox.isChecked():
             # Basic check - could add confidence slider check here
             logger.info(f"Automation enabled, queueing execution for: {summary}")
-            self.automation_log.append(f"[{time.strftime('%H:%M:%S')}] Detected: {summary}. Attempting auto-execution...")
-            # Execute after a short delay to allow UI to update
-            QTimer.singleShot(200, lambda wd=workflow_data: self.workflow_executor.execute_workflow_from_llm(wd))
+            self.automation_log.appendPlainText(f"[{time.strftime('%H:%M:%S')}] Detected: {summary}. Attempting auto-execution...")
+            self._queue_workflow_execution(workflow_data)
+
 
+    def _queue_workflow_execution(self, workflow_data: dict):
+        """Hands a workflow to the executor thread without blocking the UI."""
+        QMetaObject.invokeMethod(
+            self.workflow_executor,
+            "execute_workflow_from_llm",
+            Qt.ConnectionType.QueuedConnection,
+            Q_ARG(dict, workflow_data),
+        )
+
+    def handle_backlog_warning(self, kind: str, depth: int):
+        """Surfaces a processing backlog that is close to overflowing."""
+        self.progress_label.setText(f"Processing backlog: {depth} {kind} segment(s) waiting")
 
     # --- Workflow Management ---
 
     def _load_workflows(self):
         """Loads workflows from the database and populates the UI list."""
+        if not self._is_tab_built("workflows"):
+            return # Loaded when the tab is first shown
         logger.debug("Loading workflows from database...")
-        session = self.session_factory()
         try:
-            workflows = session.query(Workflow).order_by(Workflow.last_used.desc()).all()
-            current_selection_id = self.workflow_list.currentItem()
-            if current_selection_id:
-                current_selection_id = current_selection_id.data(Qt.ItemDataRole.UserRole)
+            # Only the columns the list shows; pattern_json is fetched lazily for details
+            with self._session_scope() as session:
+                workflows = session.execute(_WORKFLOW_LIST_STMT).all()
+            self._workflow_cache.clear() # Patterns may have been updated by re-detection
+            self._details_cache.clear()
+            current_selection_id = self.workflow_list.currentIndex().data(Qt.ItemDataRole.UserRole)
 
-            self.workflow_list.clear()
             if not workflows:
                 logger.info("No saved workflows found.")
-                placeholder = QListWidgetItem("No workflows detected yet.")
-                placeholder.setData(Qt.ItemDataRole.UserRole, None)
-                self.workflow_list.addItem(placeholder)
-            else:
-                for wf in workflows:
-                    last_used_str = wf.last_used.strftime('%Y-%m-%d %H:%M') if wf.last_used else 'Never'
-                    item = QListWidgetItem(f"{wf.name} (Last used: {last_used_str})")
-                    item.setData(Qt.ItemDataRole.UserRole, wf.id) # Store workflow ID
-                    self.workflow_list.addItem(item)
-                    # Re-select previously selected item
-                    if wf.id == current_selection_id:
-                         self.workflow_list.setCurrentItem(item)
+            self._wf_model.set_rows(workflows)
+            # Re-select previously selected workflow
+            row = self._wf_model.row_of(current_selection_id) if current_selection_id is not None else -1
+            if row >= 0:
+                self.workflow_list.setCurrentIndex(self._wf_model.index(row))
+            # A model reset does not report a selection change, so sync the details pane once
+            self.display_workflow_details(self.workflow_list.currentIndex(), None)
 
             logger.info(f"Loaded {len(workflows)} workflows into UI list.")
-            # Update dashboard count (handled by update_stats now)
+            # The full list is an exact count, so the dashboard counter needs no extra query
+            self._wf_count = len(workflows)
         except Exception as e:
             logger.exception(f"Failed to load workflows: {e}")
             QMessageBox.warning(self, "Load Error", f"Failed to load workflows: {e}")
-        finally:
-            session.close()
 
-    def display_workflow_details(self, current: Optional[QListWidgetItem], previous: Optional[QListWidgetItem]):
+    def display_workflow_details(self, current: Optional[QModelIndex], previous: Optional[QModelIndex]):
         """Shows the raw JSON pattern for the selected workflow."""
         self.workflow_details.clear()
-        is_valid_item = current is not None and current.data(Qt.ItemDataRole.UserRole) is not None
+        workflow_id = current.data(Qt.ItemDataRole.UserRole) if current is not None else None
+        is_valid_item = workflow_id is not None
 
         # Enable/disable buttons based on selection
         self.edit_workflow_btn.setEnabled(False) # Edit not implemented
         self.delete_workflow_btn.setEnabled(is_valid_item)
         self.run_workflow_btn.setEnabled(is_valid_item)
 
-        if not is_valid_item:
-            return
+        # Rendering waits until the selection settles (e.g. holding an arrow key)
+        if is_valid_item:
+            self._details_timer.start()
+        else:
+            self._details_timer.stop()
 
-        if current is None:
+    def _render_workflow_details(self):
+        """Fills the details pane for the workflow that is current once the debounce expires."""
+        workflow_id = self.workflow_list.currentIndex().data(Qt.ItemDataRole.UserRole)
+        if workflow_id is None:
+            return
+        details_text = self._details_cache.get(workflow_id)
+        if details_text is not None:
+            self.workflow_details.setPlainText(details_text)
             return
-        workflow_id = current.data(Qt.ItemDataRole.UserRole)
-        session = self.session_factory()
         try:
-            workflow = session.get(Workflow, workflow_id)
-            if workflow and workflow.pattern_json:
-                import json
-                details_text = json.dumps(workflow.pattern_json, indent=2)
-                self.workflow_details.setText(details_text)
+            pattern_json = self._get_workflow_pattern(workflow_id)
+            if pattern_json:
+                details_text = orjson.dumps(pattern_json, option=orjson.OPT_INDENT_2).decode()
+                self._details_cache[workflow_id] = details_text
+                self.workflow_details.setPlainText(details_text)
             else:
                 logger.warning(f"Workflow ID {workflow_id} not found or has no pattern data.")
-                self.workflow_details.setText(f"Error: Workflow data for ID {workflow_id} not found.")
+                self.workflow_details.setPlainText(f"Error: Workflow data for ID {workflow_id} not found.")
         except Exception as e:
             logger.exception(f"Failed to fetch workflow details for ID {workflow_id}: {e}")
-            self.workflow_details.setText(f"Error loading details: {e}")
-        finally:
-            session.close()
+            self.workflow_details.setPlainText(f"Error loading details: {e}")
+
+    def _get_workflow_pattern(self, workflow_id: int) -> Optional[Dict[str, Any]]:
+        """
+        Returns a workflow's pattern_json from the in-memory cache. On a miss, the patterns
+        for every workflow currently listed are fetched in one query.
+        """
+        if workflow_id not in self._workflow_cache:
+            ids = set(self._wf_model.workflow_ids())
+            ids.add(workflow_id)
+            with self._session_scope() as session:
+                rows = session.execute(
+                    select(Workflow.id, Workflow.pattern_json).where(Workflow.id.in_(ids))
+                ).all()
+            self._workflow_cache.update((row.id, row.pattern_json) for row in rows)
+        return self._workflow_cache.get(workflow_id)
 
     def create_workflow(self):
         QMessageBox.information(self, "Create Workflow", "Manual workflow creation is not implemented.")
@@ -751,13 +1230,13 @@ class MainWindow(QMainWindow):
 
     def delete_workflow(self):
         """Deletes the currently selected workflow from the database."""
-        current_item = self.workflow_list.currentItem()
-        if not current_item or current_item.data(Qt.ItemDataRole.UserRole) is None:
+        current = self.workflow_list.currentIndex()
+        workflow_id = current.data(Qt.ItemDataRole.UserRole)
+        if workflow_id is None:
             QMessageBox.warning(self, "Delete Workflow", "Please select a valid workflow to delete.")
             return
 
-        workflow_id = current_item.data(Qt.ItemDataRole.UserRole)
-        workflow_name = current_item.text().split(" (Last used:")[0]
+        workflow_name = current.data(WorkflowListModel.NameRole)
 
         reply = QMessageBox.question(self, "Delete Workflow",
                                       f"Are you sure you want to permanently delete workflow:\n'{workflow_name}'?",
@@ -765,59 +1244,68 @@ class MainWindow(QMainWindow):
                                       QMessageBox.StandardButton.No)
 
         if reply == QMessageBox.StandardButton.Yes:
-            session = self.session_factory()
             try:
-                workflow = session.get(Workflow, workflow_id)
-                if workflow:
-                    session.delete(workflow)
+                with self._session_scope() as session:
+                    result = session.execute(delete(Workflow).where(Workflow.id == workflow_id))
                     session.commit()
+                found = result.rowcount > 0
+                if found:
+                    if self._wf_count:
+                        self._wf_count -= 1
                     logger.info(f"Deleted workflow ID {workflow_id} ('{workflow_name}')")
-                    self._load_workflows() # Refresh the list
-                    self.workflow_details.clear() # Clear details pane
+                    # Drop just this row and show whichever row is now current
+                    self._workflow_cache.pop(workflow_id, None)
+                    self._details_cache.pop(workflow_id, None)
+                    row = self._wf_model.row_of(workflow_id) # The list may have reloaded under the dialog
+                    if row >= 0:
+                        self._wf_model.remove_row(row)
+                    self.display_workflow_details(self.workflow_list.currentIndex(), None)
                 else:
                     QMessageBox.warning(self, "Delete Error", "Workflow not found in database (perhaps already deleted?).")
                     self._load_workflows() # Refresh list anyway
             except Exception as e:
-                session.rollback()
                 logger.exception(f"Failed to delete workflow ID {workflow_id}: {e}")
                 QMessageBox.critical(self, "Delete Error", f"Failed to delete workflow: {e}")
-            finally:
-                session.close()
 
     def run_workflow(self):
         """Manually triggers the execution of the selected workflow."""
-        current_item = self.workflow_list.currentItem()
-        if not current_item or current_item.data(Qt.ItemDataRole.UserRole) is None:
+        current = self.workflow_list.currentIndex()
+        workflow_id = current.data(Qt.ItemDataRole.UserRole)
+        if workflow_id is None:
             QMessageBox.warning(self, "Run Workflow", "Please select a valid workflow to run.")
             return
 
-        workflow_id = current_item.data(Qt.ItemDataRole.UserRole)
-        session = self.session_factory()
         try:
-            workflow = session.get(Workflow, workflow_id)
-            if workflow and workflow.pattern_json:
-                workflow_name = workflow.name
-                # Ensure pattern_json is treated as the source workflow_data dict
-                workflow_data_to_run = workflow.pattern_json
-
-                logger.info(f"Manually running workflow: {workflow_name} (ID: {workflow_id})")
-                self.automation_log.append(f"[{time.strftime('%H:%M:%S')}] Manually running: {workflow_name}...")
-
-                # Execute using the executor via a short delay
-                QTimer.singleShot(100, lambda wd=workflow_data_to_run: self.workflow_executor.execute_workflow_from_llm(wd))
-
-                # Update last used time in DB
-                workflow.last_used = datetime.now(pytz.UTC) # Store as Unix timestamp float or convert to datetime
-                session.commit()
-                self._load_workflows() # Refresh list to show updated time
-            else:
+            with self._session_scope() as session:
+                workflow = session.execute(
+                    select(Workflow.name, Workflow.pattern_json).where(Workflow.id == workflow_id)
+                ).one_or_none()
+                if workflow and workflow.pattern_json:
+                    workflow_name = workflow.name
+                    # Ensure pattern_json is treated as the source workflow_data dict
+                    workflow_data_to_run = workflow.pattern_json
+                    # Update last used time in DB
+                    last_used = datetime.now(timezone.utc)
+                    session.execute(update(Workflow).where(Workflow.id == workflow_id).values(last_used=last_used))
+                    session.commit()
+                else:
+                    workflow_data_to_run = None
+            if workflow_data_to_run is None:
                 QMessageBox.warning(self, "Run Error", "Selected workflow data not found or is invalid.")
+                return
+
+            logger.info(f"Manually running workflow: {workflow_name} (ID: {workflow_id})")
+            self._ensure_tab_built(self._tab_index["automation"])
+            self.automation_log.appendPlainText(f"[{time.strftime('%H:%M:%S')}] Manually running: {workflow_name}...")
+
+            self._queue_workflow_execution(workflow_data_to_run)
+
+            # The list is ordered by last use, so move just this row to the top
+            self._wf_model.mark_used(current.row(), last_used)
+            self.workflow_list.setCurrentIndex(self._wf_model.index(0))
         except Exception as e:
-            session.rollback() # Rollback DB changes on error
             logger.exception(f"Failed to run workflow ID {workflow_id}: {e}")
             QMessageBox.critical(self, "Run Error", f"Failed to run workflow: {e}")
-        finally:
-            session.close()
 
 
     # --- Timeline Management ---
@@ -825,65 +1313,33 @@ class MainWindow(QMainWindow):
     def refresh_timeline(self):
         """Loads recent captures and events into the timeline view."""
         logger.debug("Refreshing timeline...")
-        self.timeline_tree.clear()
-        session = self.session_factory()
         try:
-            limit = 200 # Increased limit
-            # Query captures and events, filtering out deleted items
-            captures = session.query(Capture)\
-                              .filter(Capture.deleted == False)\
-                              .order_by(Capture.timestamp.desc())\
-                              .limit(limit)\
-                              .all()
-            events = session.query(Event)\
-                            .filter(Event.deleted == False)\
-                            .order_by(Event.timestamp.desc())\
-                            .limit(limit)\
-                            .all()
-
-            timeline_items_map = {} # Use dict to combine items by timestamp
-
-            for cap in captures:
-                ts = cap.timestamp
-                details = f"File: {Path(cap.file_path).name}"
-                if cap.type == 'audio' and cap.metadata_json and 'transcription' in cap.metadata_json:
-                    details += f" | Tx: '{cap.metadata_json['transcription'][:50]}...'"
-                elif cap.type == 'screen' and cap.metadata_json and 'ocr_data' in cap.metadata_json:
-                     item_count = len(cap.metadata_json['ocr_data'].get('items', []))
-                     details += f" | OCR: {item_count} items"
-
-                if ts not in timeline_items_map: timeline_items_map[ts] = []
-                timeline_items_map[ts].append({ "type": f"Capture ({cap.type})", "details": details, "app": "N/A"})
-
-            for ev in events:
-                ts = ev.timestamp
-                if ts not in timeline_items_map: timeline_items_map[ts] = []
-                timeline_items_map[ts].append({ "type": f"Event ({ev.event_type})", "details": str(ev.details_json), "app": ev.application})
-
-            # Sort timestamps descending
-            sorted_timestamps = sorted(timeline_items_map.keys(), reverse=True)
-
-            # Add to tree widget
-            added_count = 0
-            for ts in sorted_timestamps:
-                 ts_str = ts.strftime('%Y-%m-%d %H:%M:%S.%f')[:-3] # Include milliseconds
-                 for item_data in timeline_items_map[ts]:
-                      tree_item = QTreeWidgetItem([
-                          ts_str,
-                          item_data["type"],
-                          item_data["details"],
-                          item_data["app"]
-                      ])
-                      self.timeline_tree.addTopLevelItem(tree_item)
-                      added_count += 1
-
-            logger.info(f"Timeline refreshed with {added_count} items.")
+            # Stream rows into items, then hand them to the tree in one call
+            items: List[QTreeWidgetItem] = []
+            with self._session_scope() as session:
+                for row in session.execute(_TIMELINE_STMT, execution_options={"yield_per": 100}):
+                    ts_str = row.ts.isoformat(sep=' ', timespec='milliseconds') # Include milliseconds
+                    if row.source == "capture":
+                        details = f"File: {Path(row.file_path).name}"
+                        if row.kind == 'audio' and row.payload and 'transcription' in row.payload:
+                            details += f" | Tx: '{row.payload['transcription'][:50]}...'"
+                        elif row.kind == 'screen':
+                            details += f" | OCR: {row.ocr_items} items"
+                        type_str = f"Capture ({row.kind})"
+                    else:
+                        details = orjson.dumps(row.payload).decode()
+                        type_str = f"Event ({row.kind})"
+                    items.append(QTreeWidgetItem([ts_str, type_str, details, row.app]))
+
+            with _bulk_update(self.timeline_tree):
+                self.timeline_tree.clear()
+                self.timeline_tree.addTopLevelItems(items)
+
+            logger.info(f"Timeline refreshed with {len(items)} items.")
 
         except Exception as e:
             logger.exception(f"Failed to refresh timeline: {e}")
             QMessageBox.warning(self, "Timeline Error", f"Failed to load timeline data: {e}")
-        finally:
-            session.close()
 
     def export_timeline(self):
         QMessageBox.information(self, "Export Timeline", "Timeline export is not yet implemented.")
@@ -904,18 +1360,40 @@ class MainWindow(QMainWindow):
             self.settings["capture"]["monitor"] = self.monitor_spinbox.value()
 
             # Privacy Settings
-            excluded_text = self.exclude_apps_text.toPlainText()
-            self.settings["privacy"]["exclude_apps"] = [app.strip() for app in excluded_text.split("\n") if app.strip()]
-
-            # Save to JSON file
-            config_path = self.project_root / "config/settings.json"
-            save_json(config_path, self.settings) # Uses safe save (write tmp then replace)
-            logger.info(f"Settings saved to {config_path.resolve()}")
-            QMessageBox.information(self, "Settings Saved", f"Settings saved successfully.\nSome changes require restarting recording.")
-
+            if self._exclude_apps_timer.isActive(): # Edited within the debounce window
+                self._exclude_apps_timer.stop()
+                self._parse_excluded_apps()
+            self.settings["privacy"]["exclude_apps"] = list(self._excluded_apps)
         except Exception as e:
             logger.exception(f"Failed to save settings: {e}")
             QMessageBox.critical(self, "Error Saving Settings", f"Failed to save settings: {e}")
+            return
+        self._save_timer.start() # Restarted by every save within the debounce window
+
+    def _flush_settings(self):
+        """Writes a snapshot of the settings to the config file on a worker thread."""
+        if self._settings_save_signals is not None:
+            self._save_timer.start() # One write at a time; retry once the current one reports
+            return
+        task = SettingsSaveTask(self._settings_path, copy.deepcopy(self.settings))
+        task.signals.finished.connect(self._on_settings_saved)
+        self._settings_save_signals = task.signals # Keep the emitter alive until it reports
+        QThreadPool.globalInstance().start(task)
+
+    def _on_settings_saved(self, error: Optional[Exception]):
+        """Reports the background settings write on the GUI thread."""
+        self._settings_save_signals = None
+        if error is not None:
+            logger.error(f"Failed to save settings: {error}")
+            QMessageBox.critical(self, "Error Saving Settings", f"Failed to save settings: {error}")
+            return
+        logger.info(f"Settings saved to {self._settings_path.resolve()}")
+        QMessageBox.information(self, "Settings Saved", f"Settings saved successfully.\nSome changes require restarting recording.")
+
+    def _parse_excluded_apps(self):
+        """Re-reads the excluded applications box into a de-duplicated list, keeping order."""
+        text = self.exclude_apps_text.toPlainText()
+        self._excluded_apps = list(dict.fromkeys(app.strip() for app in text.split("\n") if app.strip()))
 
     # --- Application Lifecycle ---
 
@@ -940,37 +1418,50 @@ class MainWindow(QMainWindow):
         logger.info("Performing cleanup before application exit...")
 
         # 1. Stop Recording if Active
-        if self.stop_btn.isEnabled():
+        if self.stop_action.isEnabled():
             logger.info("Recording active during exit, attempting to stop gracefully...")
-            # Use BlockingQueuedConnection to ensure stop_recording finishes before continuing exit
-            QMetaObject.invokeMethod(self, "stop_recording", Qt.ConnectionType.BlockingQueuedConnection)
-            # Short sleep to allow signals/events to process after blocking call returns
-            QThread.msleep(500)
+            # Called directly: we are already on the GUI thread, so a blocking queued
+            # invocation of our own method could only deadlock
+            self.stop_recording()
             logger.info("stop_recording call completed.")
 
-
-        # 2. Stop Processing Pipeline Thread
-        if self.processing_pipeline:
-             # Stop the pipeline's internal timer first
-             logger.debug("Signaling processing pipeline timer to stop...")
-             QMetaObject.invokeMethod(self.processing_pipeline, "stop", Qt.ConnectionType.BlockingQueuedConnection) # Block here too
-        if self.processing_thread and self.processing_thread.isRunning():
-            logger.info("Quitting processing thread...")
-            self.processing_thread.quit()
-            if not self.processing_thread.wait(3000): # Wait up to 3 seconds
-                 logger.warning("Processing thread did not shut down gracefully.")
+        # Write any settings still waiting in the save debounce before exiting
+        if self._save_timer.isActive():
+            self._save_timer.stop()
+            try:
+                save_json(self._settings_path, self.settings)
+            except Exception as e:
+                logger.error(f"Failed to save settings on exit: {e}")
+
+        # 2. Ask every worker to stop first, so their shutdowns overlap the waits below
+        deadline = time.monotonic() + 3.0
+        self._rec_timer.stop()
+        if self.executor_thread.isRunning():
+            logger.info("Quitting workflow executor thread...")
+            self.workflow_executor.stop_execution()
+            self.executor_thread.quit()
+
+        # 3. Stop Processing Pipeline Thread
+        if self.processing_pipeline and self.processing_thread and self.processing_thread.isRunning():
+            # Draining stops taking files shortly before the deadline; the rest stay on disk.
+            # The pipeline quits its own thread once done, so nothing here blocks on it
+            self.processing_pipeline.set_drain_deadline(deadline - 0.5)
+            logger.debug("Signaling processing pipeline to shut down...")
+            QMetaObject.invokeMethod(self.processing_pipeline, "shutdown", Qt.ConnectionType.QueuedConnection)
+
+        # 4. Wait for all threads against one shared deadline
+        for name, thread in (("Processing", self.processing_thread),
+                             ("Workflow executor", self.executor_thread)):
+            if thread is None or not thread.isRunning():
+                continue
+            remaining_ms = max(0, int((deadline - time.monotonic()) * 1000))
+            if not thread.wait(remaining_ms):
+                logger.warning(f"{name} thread did not shut down gracefully.")
             else:
-                logger.info("Processing pipeline thread shut down.")
+                logger.info(f"{name} thread shut down.")
         self.processing_thread = None
         self.processing_pipeline = None # Clear reference
 
-
-        # 3. Stop UI Timer Thread (should already be stopped if recording was active)
-        if self.timer_thread.isRunning():
-            logger.info("Stopping UI timer thread during exit...")
-            self.timer_thread.stop() # stop() includes wait()
-            logger.info("UI timer thread shut down.")
-
         logger.info("Cleanup complete. Application will now exit.")
         # The application should exit naturally after this returns (e.g., from app.exec())
 
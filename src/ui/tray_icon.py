@@ -1,10 +1,10 @@
 from __future__ import annotations
 
 import logging
-from typing import Callable, Optional
+from typing import Callable, Optional, Tuple
 
 # Import pyqtSignal as Signal for explicit typing
-from PyQt6.QtCore import QObject, pyqtSignal, pyqtSignal as Signal
+from PyQt6.QtCore import QObject, QTimer, pyqtSignal, pyqtSignal as Signal
 from PyQt6.QtGui import QIcon, QAction, QPixmap, QPainter, QBrush, QColor, QCursor
 from PyQt6.QtWidgets import QSystemTrayIcon, QMenu, QApplication
 
@@ -18,8 +18,12 @@ class TrayIcon(QObject):
     start_recording: Signal = pyqtSignal()
     stop_recording: Signal = pyqtSignal()
     quit_app: Signal = pyqtSignal()
+
+    # Painted once per process and shared by every TrayIcon without an explicit icon
+    _default_icon: Optional[QIcon] = None
     
-    def __init__(self, app_icon: Optional[QIcon] = None):
+    def __init__(self, app_icon: Optional[QIcon] = None,
+                 recording_actions: Optional[Tuple[QAction, QAction]] = None):
         super().__init__()
         logger.debug("Initializing TrayIcon...")
         if app_icon is None:
@@ -29,18 +33,36 @@ class TrayIcon(QObject):
         
         self.tray.activated.connect(self._on_tray_activated)
         
-        # Add a local state to track recording, as the menu will be built on the fly
+        # Local recording state, mirrored into the tooltip and our own start/stop actions
         self._is_recording = False
+        # The menu and its connections are built once and reused on every right-click
+        self._menu = self._create_menu(recording_actions)
         
         logger.debug("TrayIcon initialized successfully.")
     
-    def _create_default_icon(self) -> QIcon:
-        """Create a simple default icon for the tray"""
-        pixmap = QPixmap(32, 32)
+    # Sizes painted up front so Qt picks an exact match instead of rescaling on HiDPI screens
+    _DEFAULT_ICON_SIZES = (16, 24, 32, 48, 64)
+    
+    @classmethod
+    def _create_default_icon(cls) -> QIcon:
+        """Create a simple default icon for the tray (cached after the first call)"""
+        if cls._default_icon is not None:
+            return cls._default_icon
+        icon = QIcon()
+        for size in cls._DEFAULT_ICON_SIZES:
+            icon.addPixmap(cls._paint_default_pixmap(size))
+        cls._default_icon = icon
+        return cls._default_icon
+    
+    @staticmethod
+    def _paint_default_pixmap(size: int) -> QPixmap:
+        pixmap = QPixmap(size, size)
         pixmap.fill(QColor(0, 0, 0, 0))  # Transparent background
         
         painter = QPainter(pixmap)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        # The artwork is laid out on a 32x32 grid
+        painter.scale(size / 32, size / 32)
         
         # Draw a simple circle with "AI" text
         painter.setBrush(QBrush(QColor(70, 130, 180)))  # Steel blue
@@ -52,79 +74,89 @@ class TrayIcon(QObject):
         painter.drawText(8, 8, 16, 16, 0, "AI")
         
         painter.end()
-        return QIcon(pixmap)
+        return pixmap
+    
+    def _create_menu(self, recording_actions: Optional[Tuple[QAction, QAction]]) -> QMenu:
+        menu = QMenu()
+        
+        # Main actions
+        show_action = QAction("Show Window", self)
+        show_action.triggered.connect(self.show_window.emit)
+        menu.addAction(show_action)
+        
+        menu.addSeparator()
+        
+        # Recording actions; the main window's shared pair keeps its own enabled state
+        self._owns_recording_actions = recording_actions is None
+        if recording_actions is not None:
+            self._start_action, self._stop_action = recording_actions
+        else:
+            self._start_action = QAction("Start Recording", self)
+            self._start_action.triggered.connect(self.start_recording.emit)
+            self._stop_action = QAction("Stop Recording", self)
+            self._stop_action.triggered.connect(self.stop_recording.emit)
+            self._stop_action.setEnabled(False) # Kept in sync by set_recording_state
+        menu.addAction(self._start_action)
+        menu.addAction(self._stop_action)
+        
+        menu.addSeparator()
+        
+        # Workflow actions
+        run_workflow_action = QAction("Run Last Workflow", self)
+        run_workflow_action.triggered.connect(self._run_last_workflow)
+        menu.addAction(run_workflow_action)
+        
+        menu.addSeparator()
+        
+        # System actions
+        settings_action = QAction("Settings", self)
+        settings_action.triggered.connect(self.show_settings.emit) 
+        menu.addAction(settings_action)
+        
+        about_action = QAction("About", self)
+        about_action.triggered.connect(self._show_about)
+        menu.addAction(about_action)
+        
+        menu.addSeparator()
+        
+        quit_action = QAction("Quit", self)
+        quit_action.triggered.connect(self.quit_app.emit)
+        menu.addAction(quit_action)
+        return menu
     
     def _on_tray_activated(self, reason):
         if reason == QSystemTrayIcon.ActivationReason.DoubleClick:
             show_action = QAction("Show Window")
             show_action.triggered.connect(self.show_window.emit)
             
-        elif reason == QSystemTrayIcon.ActivationReason.Context: # This is a right-click            
-            # --- Dynamically create the menu every time ---
-            menu = QMenu()
-            
-            # Main actions
-            show_action = QAction("Show Window")
-            show_action.triggered.connect(self.show_window.emit)
-            menu.addAction(show_action)
-            
-            menu.addSeparator()
-            
-            # Recording actions
-            start_action = QAction("Start Recording")
-            start_action.triggered.connect(self.start_recording.emit)
-            menu.addAction(start_action)
-            
-            stop_action = QAction("Stop Recording")
-            stop_action.triggered.connect(self.stop_recording.emit)
-            menu.addAction(stop_action)
-            
-            # Set enabled/disabled based on our local state
-            start_action.setEnabled(not self._is_recording)
-            stop_action.setEnabled(self._is_recording)
-            
-            menu.addSeparator()
-            
-            # Workflow actions
-            run_workflow_action = QAction("Run Last Workflow")
-            run_workflow_action.triggered.connect(self._run_last_workflow)
-            menu.addAction(run_workflow_action)
-            
-            menu.addSeparator()
-            
-            # System actions
-            settings_action = QAction("Settings")
-            settings_action.triggered.connect(self.show_settings.emit) 
-            menu.addAction(settings_action)
-            
-            about_action = QAction("About")
-            about_action.triggered.connect(self._show_about)
-            menu.addAction(about_action)
-            
-            menu.addSeparator()
-            
-            quit_action = QAction("Quit")
-            quit_action.triggered.connect(self.quit_app.emit)
-            menu.addAction(quit_action)
-            
+        elif reason == QSystemTrayIcon.ActivationReason.Context: # This is a right-click
             # Show the menu at the cursor's current position
-            menu.exec(QCursor.pos())
+            self._menu.exec(QCursor.pos())
+    
+    def _post_message(self, title: str, message: str, duration: int):
+        # Creating the balloon can block on some platforms; defer it so the
+        # menu that triggered it closes on this event-loop turn
+        QTimer.singleShot(0, lambda: self.tray.showMessage(
+            title, message, QSystemTrayIcon.MessageIcon.Information, duration))
     
     def _run_last_workflow(self):
         # Placeholder for running last workflow
-        self.tray.showMessage("ComputerUseAI", "Running last workflow...", 
-                            QSystemTrayIcon.MessageIcon.Information, 2000)
+        self._post_message("ComputerUseAI", "Running last workflow...", 2000)
     
     def _show_about(self):
-        self.tray.showMessage("ComputerUseAI", 
-                            "Desktop AI Assistant\nVersion 1.0\nPrivacy-First Design", 
-                            QSystemTrayIcon.MessageIcon.Information, 3000)
+        self._post_message("ComputerUseAI", 
+                           "Desktop AI Assistant\nVersion 1.0\nPrivacy-First Design", 3000)
     
     def set_recording_state(self, is_recording: bool):
         """Update menu based on recording state"""
+        if is_recording == self._is_recording:
+            return # Nothing changed; spare the window system a tooltip update
         # Store the state locally
         self._is_recording = is_recording
         logger.debug(f"Set recording state: {is_recording}")
+        if self._owns_recording_actions:
+            self._start_action.setEnabled(not is_recording)
+            self._stop_action.setEnabled(is_recording)
         
         if is_recording:
             self.tray.setToolTip("ComputerUseAI - Recording...")
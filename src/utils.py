@@ -1,9 +1,9 @@
 from __future__ import annotations
 
-import hashlib
-import json
+import atexit
+import functools
 import os
-import shutil
+import queue
 import sys
 import time
 from pathlib import Path
@@ -12,30 +12,77 @@ from typing import Any, Dict, Optional
 import logging
 import logging.handlers
 
+import orjson
+
 
 APP_NAME = "ComputerUseAI"
 
+# Writes the queued log records to the console and file handlers on a background thread
+_log_listener: Optional[logging.handlers.QueueListener] = None
+
 
 def ensure_dirs(*paths: str | Path) -> None:
     for p in paths:
-        Path(p).mkdir(parents=True, exist_ok=True)
+        # One stat for the common already-exists case, instead of a failing mkdir per level
+        if not os.path.isdir(p):
+            Path(p).mkdir(parents=True, exist_ok=True)
 
 
 def load_json(path: str | Path) -> Dict[str, Any]:
     p = Path(path)
     if not p.exists():
         return {}
-    with p.open("r", encoding="utf-8") as f:
-        return json.load(f)
+    return orjson.loads(p.read_bytes())
 
 
 def save_json(path: str | Path, data: Dict[str, Any]) -> None:
     p = Path(path)
-    p.parent.mkdir(parents=True, exist_ok=True)
+    ensure_dirs(p.parent)
     tmp = p.with_suffix(p.suffix + ".tmp")
-    with tmp.open("w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2)
-    tmp.replace(p)
+    with tmp.open("wb") as f:
+        f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        f.flush()
+        os.fsync(f.fileno()) # Contents must be on disk before the rename makes them visible
+    os.replace(tmp, p)
+    if os.name != "nt": # Persist the rename itself; Windows cannot open directories
+        dir_fd = os.open(p.parent, os.O_RDONLY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+
+
+class _FastRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """
+    RotatingFileHandler that counts what it writes, so records only pay for the stock
+    size check (a second format plus seek/tell and path stats) near the rollover point.
+    """
+    _bytes_written = 0
+    _last_len = 0
+
+    def _open(self):
+        stream = super()._open()
+        self._bytes_written = os.fstat(stream.fileno()).st_size
+        return stream
+
+    def format(self, record: logging.LogRecord) -> str:
+        msg = super().format(record)
+        self._last_len = len(msg) + len(self.terminator)
+        return msg
+
+    def emit(self, record: logging.LogRecord) -> None:
+        super().emit(record)
+        self._bytes_written += self._last_len
+
+    def shouldRollover(self, record: logging.LogRecord) -> bool:
+        # Characters approximate bytes, so defer to the exact check from 90% onwards
+        if self.maxBytes <= 0 or self._bytes_written < self.maxBytes * 0.9:
+            return False
+        return bool(super().shouldRollover(record))
+
+    def doRollover(self) -> None:
+        super().doRollover()
+        self._bytes_written = 0
 
 
 def configure_logging(log_dir: str | Path = "data/logs", level: Optional[str] = None) -> None:
@@ -56,45 +103,84 @@ def configure_logging(log_dir: str | Path = "data/logs", level: Optional[str] =
     
     # Clear existing handlers
     logger.handlers.clear()
+    _stop_log_listener()
     
+    # The format uses no thread or process fields, so records need not collect them
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+    # One formatter shared by both handlers
+    formatter = logging.Formatter(
+        '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+
     # Console handler
     console_handler = logging.StreamHandler(sys.stderr)
     console_handler.setLevel(getattr(logging, level_str))
-    console_formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-    )
-    console_handler.setFormatter(console_formatter)
-    logger.addHandler(console_handler)
+    console_handler.setFormatter(formatter)
     
     # File handler with rotation
     log_file = Path(log_dir) / f"{APP_NAME.lower()}.log"
-    file_handler = logging.handlers.RotatingFileHandler(
+    file_handler = _FastRotatingFileHandler(
         str(log_file), maxBytes=10*1024*1024, backupCount=7
     )
     file_handler.setLevel(getattr(logging, level_str))
-    file_formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    file_handler.setFormatter(formatter)
+
+    # Logging threads only enqueue records; the listener thread does the writes
+    global _log_listener
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    _log_listener = logging.handlers.QueueListener(
+        log_queue, console_handler, file_handler, respect_handler_level=True
     )
-    file_handler.setFormatter(file_formatter)
-    logger.addHandler(file_handler)
+    _log_listener.start()
+
+
+def _stop_log_listener() -> None:
+    """Flushes the queued log records and closes the handlers of the running listener."""
+    global _log_listener
+    if _log_listener is None:
+        return
+    _log_listener.stop()
+    for handler in _log_listener.handlers:
+        handler.close()
+    _log_listener = None
+
+
+atexit.register(_stop_log_listener)
+
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB", "PB")
+
 
 def human_size(num_bytes: int) -> str:
-    for unit in ["B", "KB", "MB", "GB", "TB"]:
-        if num_bytes < 1024.0:
-            return f"{num_bytes:3.1f} {unit}"
-        num_bytes //= 1024
-    return f"{num_bytes:.1f} PB"
+    if num_bytes < 1024:
+        return f"{num_bytes:3.1f} B"
+    # Each unit spans 10 bits, so the bit length picks the unit without a loop
+    idx = min(len(_SIZE_UNITS) - 1, (int(num_bytes).bit_length() - 1) // 10)
+    return f"{num_bytes / (1 << (idx * 10)):3.1f} {_SIZE_UNITS[idx]}"
 
 
 def sha256_file(path: str | Path) -> str:
-    h = hashlib.sha256()
-    with open(path, "rb") as f:
-        for chunk in iter(lambda: f.read(8192), b""):
-            h.update(chunk)
+    import hashlib
+
+    with open(path, "rb", buffering=0) as f:
+        if hasattr(hashlib, "file_digest"):  # Python 3.11+: read loop runs in C
+            return hashlib.file_digest(f, "sha256").hexdigest()
+        h = hashlib.sha256()
+        # One reusable 1 MiB buffer; unbuffered reads go straight into it
+        buf = bytearray(1 << 20)
+        view = memoryview(buf)
+        while n := f.readinto(buf):
+            h.update(view[:n])
     return h.hexdigest()
 
 
+@functools.lru_cache(maxsize=1)
 def tesseract_installed() -> bool:
+    import shutil
+
+    # Scans every PATH entry, so the answer is cached; call cache_clear() after installing
     return shutil.which("tesseract") is not None
 
 
@@ -106,6 +192,11 @@ def platform_name() -> str:
     return "Linux"
 
 
+# 1, 2, 4, ... seconds, saturating at 60 from index 6 onwards
+_BACKOFF_SCHEDULE = tuple(min(60, 1 << i) for i in range(7))
+
+
 def retry_sleep(backoff_index: int) -> None:
-    time.sleep(min(60, 2 ** backoff_index))
+    idx = min(max(backoff_index, 0), len(_BACKOFF_SCHEDULE) - 1)
+    time.sleep(_BACKOFF_SCHEDULE[idx])
 
@@ -1 +1 @@
-# Test package for ComputerUseAI
+# Test package for ComputerUseAI
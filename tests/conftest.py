@@ -93,13 +93,10 @@ def sample_events():
     ]
 
 
-@pytest.fixture(autouse=True)
-def mock_pyautogui():
-    """Mock pyautogui for all tests to avoid actual system interactions"""
-    import sys
+def _configure_pyautogui(mock_pyautogui):
+    """Default return values for the shared pyautogui mock"""
     from unittest.mock import Mock
-    
-    mock_pyautogui = Mock()
+
     mock_pyautogui.click.return_value = None
     mock_pyautogui.typewrite.return_value = None
     mock_pyautogui.press.return_value = None
@@ -108,22 +105,47 @@ def mock_pyautogui():
     mock_pyautogui.screenshot.return_value = Mock()
     mock_pyautogui.locateOnScreen.return_value = None
     mock_pyautogui.center.return_value = Mock(x=100, y=200)
+
+
+def _configure_win32gui(mock_win32gui):
+    """Default return values for the shared win32gui mock"""
+    mock_win32gui.GetForegroundWindow.return_value = 123
+    mock_win32gui.GetWindowText.return_value = "Test Window"
+    mock_win32gui.GetWindowThreadProcessId.return_value = (456, 789)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def mock_pyautogui():
+    """Mock pyautogui for all tests to avoid actual system interactions"""
+    import sys
+    from unittest.mock import Mock
+    
+    mock_pyautogui = Mock()
+    _configure_pyautogui(mock_pyautogui)
     
     sys.modules['pyautogui'] = mock_pyautogui
     yield mock_pyautogui
 
 
-@pytest.fixture(autouse=True)
+@pytest.fixture(scope="session", autouse=True)
 def mock_win32gui():
     """Mock win32gui for Windows-specific tests"""
     import sys
     from unittest.mock import Mock
     
     mock_win32gui = Mock()
-    mock_win32gui.GetForegroundWindow.return_value = 123
-    mock_win32gui.GetWindowText.return_value = "Test Window"
-    mock_win32gui.GetWindowThreadProcessId.return_value = (456, 789)
+    _configure_win32gui(mock_win32gui)
     
     sys.modules['win32gui'] = mock_win32gui
     sys.modules['win32process'] = Mock()
     yield mock_win32gui
+
+
+@pytest.fixture(autouse=True)
+def reset_system_mocks(mock_pyautogui, mock_win32gui):
+    """Restores the shared session mocks between tests: calls, return values and side effects"""
+    yield
+    mock_pyautogui.reset_mock(return_value=True, side_effect=True)
+    _configure_pyautogui(mock_pyautogui)
+    mock_win32gui.reset_mock(return_value=True, side_effect=True)
+    _configure_win32gui(mock_win32gui)
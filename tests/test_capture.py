@@ -1,4 +1,5 @@
 import numpy as np
+import pytest
 import tempfile
 from pathlib import Path
 from unittest.mock import Mock, patch
@@ -8,6 +9,19 @@ from src.capture.audio_capture import AudioCapture, AudioCaptureConfig
 from src.capture.event_tracker import EventTracker, EventTrackerConfig
 
 
+# Shared read-only frames for the frame difference checks
+_BLACK_FRAME = np.zeros((100, 100, 3), dtype=np.uint8)
+_BLACK_FRAME.setflags(write=False)
+_WHITE_FRAME = np.full((100, 100, 3), 255, dtype=np.uint8)
+_WHITE_FRAME.setflags(write=False)
+
+
+@pytest.fixture(scope="class")
+def capture(tmp_path_factory):
+    """Default-config ScreenCapture shared by the tests that only read from it"""
+    return ScreenCapture(str(tmp_path_factory.mktemp("screen")), ScreenCaptureConfig())
+
+
 class TestScreenCapture:
     def test_initialization(self):
         config = ScreenCaptureConfig(fps=3, quality=70)
@@ -17,44 +31,43 @@ class TestScreenCapture:
             assert capture.config.quality == 70
             assert capture.output_dir == Path(temp_dir)
 
-    def test_frame_difference_ratio(self):
-        config = ScreenCaptureConfig()
-        with tempfile.TemporaryDirectory() as temp_dir:
-            capture = ScreenCapture(temp_dir, config)
-            
-            # Test with identical frames
-            import numpy as np
-            frame1 = np.zeros((100, 100, 3), dtype=np.uint8)
-            frame2 = np.zeros((100, 100, 3), dtype=np.uint8)
-            ratio = capture._frame_difference_ratio(frame1, frame2)
-            assert ratio == 0.0
-            
-            # Test with completely different frames
-            frame3 = np.ones((100, 100, 3), dtype=np.uint8) * 255
-            ratio = capture._frame_difference_ratio(frame1, frame3)
-            assert ratio == 1.0
-
-    @patch('src.capture.screen_capture.mss.mss')
-    def test_grab_frame(self, mock_mss):
-        config = ScreenCaptureConfig()
+    def test_frame_difference_ratio(self, capture):
+        # Test with identical frames
+        ratio = capture._frame_difference_ratio(_BLACK_FRAME, _BLACK_FRAME)
+        assert ratio == 0.0
+        
+        # Test with completely different frames
+        ratio = capture._frame_difference_ratio(_BLACK_FRAME, _WHITE_FRAME)
+        assert ratio == 1.0
+
+    def test_grab_frame(self, capture, monkeypatch):
+        # Mock mss grab to return a valid screenshot object
+        mock_sct = Mock()
+        # Simulate a 100x100 BGRX image (common mss format)
+        mock_sct_img_data = np.zeros((100, 100, 4), dtype=np.uint8)
+        mock_sct_img_data[:, :, 0] = 255 # Blue channel
+        mock_sct_img_data[:, :, 3] = 255 # Alpha channel
+        
+        mock_sct.grab.return_value = mock_sct_img_data
+        mock_sct.monitors = [{"top": 0, "left": 0, "width": 1920, "height": 1080}]
+        # monkeypatch restores the shared instance afterwards
+        monkeypatch.setattr(capture, "_mss", mock_sct)
+        
+        frame = capture._grab()
+        assert frame is not None
+        assert frame.shape == (100, 100, 3) # Expecting BGR frame after processing
+        assert np.array_equal(frame[:, :, 0], np.ones((100, 100)) * 255) # Check blue channel
+
+    def test_save_frame_reports_written_file(self):
+        config = ScreenCaptureConfig(format="png")
         with tempfile.TemporaryDirectory() as temp_dir:
             capture = ScreenCapture(temp_dir, config)
-            
-            # Mock mss grab to return a valid screenshot object
-            mock_sct = Mock()
-            # Simulate a 100x100 BGRX image (common mss format)
-            mock_sct_img_data = np.zeros((100, 100, 4), dtype=np.uint8)
-            mock_sct_img_data[:, :, 0] = 255 # Blue channel
-            mock_sct_img_data[:, :, 3] = 255 # Alpha channel
-            
-            mock_sct.grab.return_value = mock_sct_img_data
-            mock_sct.monitors = [{"top": 0, "left": 0, "width": 1920, "height": 1080}]
-            capture._mss = mock_sct
-            
-            frame = capture._grab()
-            assert frame is not None
-            assert frame.shape == (100, 100, 3) # Expecting BGR frame after processing
-            assert np.array_equal(frame[:, :, 0], np.ones((100, 100)) * 255) # Check blue channel
+            written = []
+            capture.file_written.connect(lambda path, size: written.append((path, size)))
+
+            frame = np.zeros((10, 10, 3), dtype=np.uint8)
+            path = capture._save_frame(frame, 1700000000.5)
+            assert written == [(str(path), path.stat().st_size)]
 
 class TestAudioCapture:
     def test_initialization(self):
@@ -98,11 +111,26 @@ class TestEventTracker:
         with tempfile.TemporaryDirectory() as temp_dir:
             config = EventTrackerConfig(log_path=Path(temp_dir) / "events.log")
             tracker = EventTracker(config)
+            tracker._running = True
             
             tracker._log("test_event", {"key": "value"})
+            tracker.flush()  # Events are buffered before being appended
             
             # Check if log file was created and contains the event
             assert config.log_path.exists()
-            content = config.log_path.read_text()
-            assert "test_event" in content
-            assert "key" in content
+            content = config.log_path.read_bytes()
+            assert b"test_event" in content
+            assert b"key" in content
+            tracker.stop()
+
+    @patch.object(EventTracker, '_active_process_name', return_value="KeePass.exe")
+    def test_log_event_skips_excluded_app(self, mock_process_name):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config = EventTrackerConfig(log_path=Path(temp_dir) / "events.log", exclude_apps=["keepass", " "])
+            tracker = EventTracker(config)
+            tracker._running = True
+            
+            tracker._log("key_press", {"key": "a"})
+            tracker.flush()
+            
+            assert not config.log_path.exists()
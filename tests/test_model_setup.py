@@ -0,0 +1,174 @@
+import hashlib
+import http.server
+import threading
+import time
+from collections import Counter
+
+import pytest
+import requests
+
+from tools import model_setup
+
+
+_DATA = bytes(range(256)) * 1024  # 256 KiB, split into 16 ranges
+_DIGEST = hashlib.sha256(_DATA).hexdigest()
+_PIECE = len(_DATA) // 16
+
+
+def _serve(throttle=lambda rng, n: None, data=_DATA, etag=None, probe_delay=0.0):
+    """Starts a range-capable stub server; throttle(range_header, hits) picks an error status or None
+
+    It advertises the SHA-256 of _DATA as Hugging Face does, whatever data it actually serves.
+    """
+    hits = Counter()
+    lock = threading.Lock()
+
+    class Handler(http.server.BaseHTTPRequestHandler):
+        def log_message(self, *args):
+            pass
+
+        def do_GET(self):
+            rng = self.headers["Range"]
+            with lock:
+                hits[rng] += 1
+                status = throttle(rng, hits[rng])
+            if etag and self.headers["If-None-Match"] == etag:
+                status = 304
+            if rng == "bytes=0-0":
+                time.sleep(probe_delay)
+            if status:
+                self.send_response(status)
+                self.send_header("Retry-After", "0")
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            start, _, end = rng[len("bytes="):].partition("-")
+            body = data[int(start):int(end) + 1]
+            self.send_response(206)
+            self.send_header("Content-Range", f"bytes {start}-{int(start) + len(body) - 1}/{len(data)}")
+            self.send_header("Content-Length", str(len(body)))
+            self.send_header("X-Linked-Etag", f'"{_DIGEST}"')
+            if etag:
+                self.send_header("ETag", etag)
+            self.end_headers()
+            self.wfile.write(body)
+
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}/model.gguf", hits
+
+
+@pytest.fixture
+def throttle_calls(monkeypatch):
+    """Counts controller back-offs; retry sleeps are skipped"""
+    calls = []
+    original = model_setup._ConcurrencyController.throttled
+
+    def throttled(self):
+        calls.append(self.limit)
+        original(self)
+
+    monkeypatch.setattr(model_setup._ConcurrencyController, "throttled", throttled)
+    monkeypatch.setattr(model_setup, "retry_sleep", lambda attempt: None)
+    return calls
+
+
+class TestRangeThrottling:
+    @pytest.mark.parametrize("status", [429, 503])
+    def test_throttled_ranges_back_off_and_retry(self, tmp_path, throttle_calls, status):
+        # First request for every range is refused; the probe is always served
+        server, url, hits = _serve(lambda rng, n: status if rng != "bytes=0-0" and n == 1 else None)
+        try:
+            tmp = tmp_path / "model.gguf.part"
+            model_setup._download_ranged(url, tmp, len(_DATA))
+        finally:
+            server.shutdown()
+        assert tmp.read_bytes() == _DATA
+        ranges = [rng for rng in hits if rng != "bytes=0-0"]
+        # Each refusal reached the controller instead of being retried inside urllib3
+        assert all(hits[rng] == 2 for rng in ranges)
+        assert len(throttle_calls) == len(ranges)
+
+    def test_persistent_throttling_fails_the_download(self, tmp_path, throttle_calls):
+        server, url, hits = _serve(lambda rng, n: 503)
+        try:
+            with pytest.raises(requests.HTTPError):
+                model_setup._download_ranged(url, tmp_path / "model.gguf.part", len(_DATA))
+        finally:
+            server.shutdown()
+        assert max(hits.values()) == model_setup._MAX_THROTTLE_RETRIES + 1
+
+    def test_fatal_error_stops_waiting_workers(self, tmp_path):
+        server, url, hits = _serve(lambda rng, n: 404)
+        try:
+            with pytest.raises(requests.HTTPError):
+                model_setup._download_ranged(url, tmp_path / "model.gguf.part", len(_DATA))
+        finally:
+            server.shutdown()
+        # Only the requests already in flight when the first one failed were sent
+        assert sum(hits.values()) <= model_setup.INITIAL_DOWNLOAD_CONNECTIONS
+
+
+class TestResume:
+    def test_pieces_cut_with_another_length_are_not_trusted(self, tmp_path):
+        tmp = tmp_path / "model.gguf.part"
+        tmp.write_bytes(bytes(len(_DATA)))
+        # Left by a run with 4 KiB pieces; the current length is 16 KiB
+        model_setup._progress_path(tmp).write_text(f"{len(_DATA)} 4096\n0\n4096\n")
+        server, url, hits = _serve(lambda rng, n: None)
+        try:
+            model_setup._download_ranged(url, tmp, len(_DATA))
+        finally:
+            server.shutdown()
+        assert tmp.read_bytes() == _DATA
+        assert hits["bytes=0-16383"] == 1
+
+
+@pytest.fixture
+def ranged(monkeypatch):
+    """Sends even the small stub file down the ranged path"""
+    monkeypatch.setattr(model_setup, "MIN_RANGED_BYTES", 0)
+
+
+class TestDownloadFile:
+    def test_resumes_from_partial_ranges_file(self, tmp_path, ranged):
+        dest = tmp_path / "model.gguf"
+        tmp = dest.with_suffix(".gguf.part")
+        # First half downloaded by an earlier run
+        tmp.write_bytes(_DATA[:len(_DATA) // 2] + bytes(len(_DATA) // 2))
+        done = "".join(f"{start}\n" for start in range(0, len(_DATA) // 2, _PIECE))
+        model_setup._progress_path(tmp).write_text(f"{len(_DATA)} {_PIECE}\n{done}")
+        server, url, hits = _serve()
+        try:
+            model_setup.download_file(url, dest)
+        finally:
+            server.shutdown()
+        assert dest.read_bytes() == _DATA
+        assert not tmp.exists() and not model_setup._progress_path(tmp).exists()
+        fetched = {rng for rng in hits if rng != "bytes=0-0"}
+        assert fetched == {f"bytes={start}-{start + _PIECE - 1}" for start in range(len(_DATA) // 2, len(_DATA), _PIECE)}
+
+    def test_sha_mismatch_fails_over_to_next_mirror(self, tmp_path, ranged):
+        dest = tmp_path / "model.gguf"
+        corrupt = bytes(reversed(_DATA))
+        # The corrupt mirror answers its probe first, so it is tried first
+        bad_server, bad_url, bad_hits = _serve(data=corrupt)
+        good_server, good_url, good_hits = _serve(probe_delay=0.3)
+        try:
+            model_setup.download_file([good_url, bad_url], dest)
+        finally:
+            bad_server.shutdown()
+            good_server.shutdown()
+        assert dest.read_bytes() == _DATA
+        assert len(bad_hits) > 1 and len(good_hits) > 1
+
+    def test_not_modified_keeps_dest(self, tmp_path):
+        dest = tmp_path / "model.gguf"
+        dest.write_bytes(b"installed")
+        server, url, hits = _serve(etag='"v1"')
+        try:
+            assert model_setup.download_file(url, dest, etag='"v1"') == '"v1"'
+        finally:
+            server.shutdown()
+        assert dest.read_bytes() == b"installed"
+        assert list(hits) == ["bytes=0-0"]
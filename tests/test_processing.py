@@ -1,6 +1,8 @@
 import numpy as np
 import numpy.testing
+import pytest
 import tempfile
+import time
 from pathlib import Path
 from unittest.mock import Mock, patch
 
@@ -14,10 +16,14 @@ from src.processing.pattern_recognition import (
 )
 
 
+@pytest.fixture(scope="class")
+def stt():
+    """Default-config engine; loading the Whisper model once covers the whole class"""
+    return SpeechToText(STTConfig(model_path=Path("base"))) # Use a valid model name
+
+
 class TestSpeechToText:
-    def test_initialization(self):
-        config = STTConfig(model_path=Path("base")) # Use a valid model name
-        stt = SpeechToText(config)
+    def test_initialization(self, stt):
         assert stt.config.model_path == Path("base")
 
     @patch('src.processing.speech_to_text.sf.read')
@@ -64,10 +70,8 @@ class TestSpeechToText:
             # Assert content using numpy.testing.assert_array_equal
             np.testing.assert_array_equal(actual_audio_data, np.zeros(16000, dtype=np.float32))
 
-    def test_transcribe_file_no_engine(self):
-        config = STTConfig()
-        stt = SpeechToText(config)
-        stt._engine = None
+    def test_transcribe_file_no_engine(self, stt, monkeypatch):
+        monkeypatch.setattr(stt, "_engine", None)
         
         with tempfile.NamedTemporaryFile(suffix=".wav") as temp_file:
             result = stt.transcribe_file(temp_file.name)
@@ -77,18 +81,18 @@ class TestSpeechToText:
             assert result["timestamps"] == []
 
 
+@pytest.fixture(scope="class")
+def ocr():
+    return OCREngine(OCRConfig(language="eng"))
+
+
 class TestOCREngine:
-    def test_initialization(self):
-        config = OCRConfig(language="eng")
-        ocr = OCREngine(config)
+    def test_initialization(self, ocr):
         assert ocr.config.language == "eng"
 
     @patch('src.processing.ocr_engine.pytesseract.image_to_data')
     @patch('src.processing.ocr_engine.Image.open')
-    def test_extract_text(self, mock_image_open, mock_image_to_data):
-        config = OCRConfig()
-        ocr = OCREngine(config)
-        
+    def test_extract_text(self, mock_image_open, mock_image_to_data, ocr):
         # Mock pytesseract response
         mock_image_to_data.return_value = {
             "text": ["Hello", "World", ""],
@@ -107,16 +111,16 @@ class TestOCREngine:
             assert result["items"][0]["conf"] == 85
 
 
+@pytest.fixture(scope="class")
+def analyzer():
+    return ScreenAnalyzer(ScreenAnalyzerConfig())
+
+
 class TestScreenAnalyzer:
-    def test_initialization(self):
-        config = ScreenAnalyzerConfig()
-        analyzer = ScreenAnalyzer(config)
+    def test_initialization(self, analyzer):
         assert analyzer.config is not None
 
-    def test_generate_screen_json(self):
-        config = ScreenAnalyzerConfig()
-        analyzer = ScreenAnalyzer(config)
-        
+    def test_generate_screen_json(self, analyzer):
         ocr_data = {
             "items": [
                 {"text": "Save", "conf": 90},
@@ -176,3 +180,90 @@ class TestPatternRecognition:
         patterns = detect_repetitive_patterns(workflows, threshold=0.8)
         assert len(patterns) == 1  # Should detect one pattern
         assert patterns[0]["occurrences"] == 3
+
+
+@pytest.fixture
+def make_pipeline(tmp_path):
+    """Builds a ProcessingPipeline with its models and database stubbed out"""
+    # The pipeline pulls in llama_cpp through the LLM interface, which exits without it
+    pytest.importorskip("llama_cpp")
+    from src.processing.pipeline import ProcessingPipeline
+
+    def make(queue_size):
+        with patch.multiple(
+            "src.processing.pipeline",
+            SpeechToText=Mock(), OCREngine=Mock(), LocalLLM=Mock(), initialize_database=Mock(),
+        ):
+            pipeline = ProcessingPipeline({"processing": {"queue_size": queue_size}}, tmp_path)
+        pipeline.process_audio = Mock()
+        pipeline.process_video = Mock()
+        return pipeline
+    return make
+
+
+def _processed(handler):
+    return [c.args[0] for c in handler.call_args_list]
+
+
+class TestPipelineBacklog:
+    def test_full_backlog_drops_oldest_and_deletes_it(self, make_pipeline, tmp_path):
+        pipeline = make_pipeline(4)
+        segments = []
+        for i in range(6):
+            segment = tmp_path / f"audio_{i}.wav"
+            segment.write_bytes(b"RIFF")
+            segments.append(str(segment))
+            pipeline.enqueue_audio(str(segment))
+
+        pipeline.drain_queues(batch_size=None)
+        assert _processed(pipeline.process_audio) == segments[2:]
+        # Dropped segments have no Capture row, so they must not linger on disk
+        assert not Path(segments[0]).exists() and not Path(segments[1]).exists()
+
+    def test_backlog_warning_from_75_percent(self, make_pipeline):
+        pipeline = make_pipeline(4)
+        warnings = []
+        pipeline.backlog_warning.connect(lambda kind, depth: warnings.append((kind, depth)))
+        for i in range(4):
+            pipeline.enqueue_video(f"video_{i}.mp4")
+        assert warnings == [("video", 3), ("video", 4)]
+
+    def test_drain_is_batched(self, make_pipeline):
+        pipeline = make_pipeline(6)
+        for i in range(6):
+            pipeline.enqueue_audio(f"audio_{i}.wav")
+            pipeline.enqueue_video(f"video_{i}.mp4")
+
+        assert pipeline.drain_queues() == 2 * pipeline.DRAIN_BATCH_SIZE
+        assert pipeline.queue_depth == 12 - 2 * pipeline.DRAIN_BATCH_SIZE
+        assert _processed(pipeline.process_audio) == [f"audio_{i}.wav" for i in range(pipeline.DRAIN_BATCH_SIZE)]
+
+    def test_stop_drains_the_rest(self, make_pipeline):
+        pipeline = make_pipeline(6)
+        for i in range(6):
+            pipeline.enqueue_audio(f"audio_{i}.wav")
+            pipeline.enqueue_video(f"video_{i}.mp4")
+
+        pipeline.stop()
+        assert pipeline.queue_depth == 0
+        assert len(_processed(pipeline.process_audio)) == len(_processed(pipeline.process_video)) == 6
+
+    def test_shutdown_drain_stops_at_deadline(self, make_pipeline):
+        pipeline = make_pipeline(6)
+        for i in range(3):
+            pipeline.enqueue_audio(f"audio_{i}.wav")
+
+        pipeline.set_drain_deadline(time.monotonic() - 1)
+        pipeline.shutdown()
+        # Past the deadline nothing more is taken; the segments stay queued and on disk
+        pipeline.process_audio.assert_not_called()
+        assert pipeline.queue_depth == 3
+
+    @pytest.mark.parametrize("queue_size", [0, -1, "8"])
+    def test_invalid_queue_size_uses_default(self, make_pipeline, queue_size):
+        pipeline = make_pipeline(queue_size)
+        assert pipeline._audio_q.maxsize == pipeline.DEFAULT_QUEUE_SIZE
+        warnings = []
+        pipeline.backlog_warning.connect(lambda kind, depth: warnings.append(depth))
+        pipeline.enqueue_audio("audio_0.wav")
+        assert warnings == []
@@ -1,43 +1,417 @@
 from __future__ import annotations
 
+import os
+import queue
+import re
+import shutil
 import sys
-import urllib.request
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
+from typing import NamedTuple, Sequence
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # Ensure project root is on sys.path to import src.* when executed as a script
 ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
-from src.utils import tesseract_installed
+from src.utils import load_json, retry_sleep, save_json, sha256_file, tesseract_installed
+
+
+CHUNK_SIZE = 1 << 20
+# Parallel range requests per file; a single TCP stream rarely fills the link. The
+# controller starts low and grows while throughput does, up to the cap HF LFS tolerates
+INITIAL_DOWNLOAD_CONNECTIONS = 2
+MAX_DOWNLOAD_CONNECTIONS = 8
+# Below this size, splitting into ranges costs more in requests than it saves
+MIN_RANGED_BYTES = 16 << 20
+# Largest range fetched by one request; also how much an interrupted ranged download can lose
+PIECE_BYTES = 64 << 20
+
+# Pinned digests by file name; these take precedence over what the server advertises
+EXPECTED_SHA256: dict[str, str] = {}
+
+_CONTENT_RANGE_RE = re.compile(r"bytes \d+-\d+/(\d+)")
+# Hugging Face serves LFS files with their SHA-256 as the linked ETag
+_SHA256_ETAG_RE = re.compile(r'(?:W/)?"?([0-9a-f]{64})"?')
+# (connect, read) seconds
+_TIMEOUT = (10, 30)
+# Rate-limit answers: back off instead of failing the download
+_THROTTLE_STATUSES = frozenset({429, 503})
+_MAX_THROTTLE_RETRIES = 5
+
+
+def _make_session(
+    status_forcelist: tuple[int, ...] = (502, 503, 504), respect_retry_after: bool = True
+) -> requests.Session:
+    # Pooled so keep-alive sockets are reused instead of paying a TLS handshake per request
+    session = requests.Session()
+    retries = Retry(
+        total=5,
+        backoff_factor=0.5,
+        status_forcelist=status_forcelist,
+        respect_retry_after_header=respect_retry_after,
+    )
+    adapter = HTTPAdapter(pool_connections=8, pool_maxsize=8, max_retries=retries)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    # Byte offsets must refer to the file itself, not a compressed transfer
+    session.headers["Accept-Encoding"] = "identity"
+    return session
+
+
+# Probes and single-stream downloads
+_SESSION = _make_session()
+# Range workers: 429/503 must reach the concurrency controller, which backs off itself,
+# rather than being retried inside urllib3
+_RANGE_SESSION = _make_session(status_forcelist=(502, 504), respect_retry_after=False)
+
+
+class _RangeNotSupported(Exception):
+    pass
+
+
+class _Probe(NamedTuple):
+    not_modified: bool
+    size: int | None  # Only set when the server honours byte ranges
+    digest: str | None
+    etag: str | None
+
+
+def _probe(url: str, etag: str | None = None) -> _Probe:
+    """Checks range support, the advertised SHA-256 and, given an ETag, whether the file changed"""
+    # A one-byte ranged GET answers every question in a single round trip
+    headers = {"Range": "bytes=0-0"}
+    if etag:
+        headers["If-None-Match"] = etag
+    with _SESSION.get(url, headers=headers, stream=True, timeout=_TIMEOUT) as r:
+        if r.status_code == 304:
+            return _Probe(True, None, None, etag)
+        r.raise_for_status()
+        digest = None
+        # The hub answers with a redirect to the CDN; the digest is on the redirect
+        for resp in (*r.history, r):
+            match = _SHA256_ETAG_RE.fullmatch(resp.headers.get("X-Linked-Etag", ""))
+            if match:
+                digest = match.group(1)
+        match = _CONTENT_RANGE_RE.fullmatch(r.headers.get("Content-Range", ""))
+        size = int(match.group(1)) if r.status_code == 206 and match else None
+        return _Probe(False, size, digest, r.headers.get("ETag"))
+
+
+def _download_range(url: str, tmp: Path, start: int, end: int) -> None:
+    headers = {"Range": f"bytes={start}-{end}"}
+    with _RANGE_SESSION.get(url, headers=headers, stream=True, timeout=_TIMEOUT) as r:
+        r.raise_for_status()
+        if r.status_code != 206:
+            raise _RangeNotSupported(f"server answered {r.status_code} to a range request")
+        # Every worker has its own handle, so seeks never race (and no pwrite on Windows)
+        with open(tmp, "r+b") as f:
+            f.seek(start)
+            shutil.copyfileobj(r.raw, f, length=CHUNK_SIZE)
+            if f.tell() != end + 1:
+                raise IOError(f"range {start}-{end} ended early at byte {f.tell()}")
+            # On disk before the piece is recorded as done
+            f.flush()
+            os.fsync(f.fileno())
+
+
+def _progress_path(tmp: Path) -> Path:
+    return tmp.with_suffix(tmp.suffix + ".ranges")
+
+
+def _completed_pieces(progress: Path, tmp: Path, size: int, piece: int) -> set[int] | None:
+    """Piece offsets finished by an earlier run, or None if there is nothing to resume"""
+    try:
+        header, *offsets = progress.read_text().splitlines()
+        # Offsets only mean anything with the piece length they were cut with
+        if header.split() != [str(size), str(piece)] or tmp.stat().st_size != size:
+            return None
+        return {int(line) for line in offsets}
+    except (OSError, ValueError):
+        return None
+
+
+def _preallocate(f, size: int) -> None:
+    # Sized up front so every range can seek straight to its offset. Real blocks let the
+    # filesystem lay the file out in few extents, which llama.cpp later mmaps sequentially
+    if hasattr(os, "posix_fallocate"):
+        try:
+            os.posix_fallocate(f.fileno(), 0, size)
+            return
+        except OSError:
+            pass  # Unsupported by the filesystem (e.g. ZFS); fall back to a sparse file
+    f.truncate(size)
+
+
+class _ConcurrencyController:
+    """AIMD-style limit on in-flight range requests
 
+    Doubles the limit each window in which throughput grew by more than 10%, halves it
+    when throughput collapses or the server throttles.
+    """
 
-def download_file(url: str, dest: Path) -> None:
+    WINDOW_SECONDS = 2.0
+
+    def __init__(self, initial: int, ceiling: int) -> None:
+        self.limit = initial
+        self.ceiling = ceiling
+        self._active = 0
+        self._cond = threading.Condition()
+        self._window_start = time.monotonic()
+        self._window_bytes = 0
+        self._last_rate = 0.0
+
+    def acquire(self) -> None:
+        with self._cond:
+            while self._active >= self.limit:
+                self._cond.wait()
+            self._active += 1
+
+    def release(self, nbytes: int = 0) -> None:
+        with self._cond:
+            self._active -= 1
+            self._window_bytes += nbytes
+            now = time.monotonic()
+            elapsed = now - self._window_start
+            if nbytes and elapsed >= self.WINDOW_SECONDS:
+                rate = self._window_bytes / elapsed
+                if rate > self._last_rate * 1.1:
+                    self.limit = min(self.ceiling, self.limit * 2)
+                elif rate < self._last_rate * 0.5:
+                    self.limit = max(1, self.limit // 2)
+                self._last_rate = rate
+                self._window_start, self._window_bytes = now, 0
+            self._cond.notify_all()
+
+    def throttled(self) -> None:
+        with self._cond:
+            self.limit = max(1, self.limit // 2)
+
+
+def _download_ranged(url: str, tmp: Path, size: int) -> None:
+    # At least two pieces per possible worker, so there is work to hand out as the limit grows
+    piece = min(PIECE_BYTES, -(-size // (MAX_DOWNLOAD_CONNECTIONS * 2)))
+    # The .ranges sidecar holds "size piece", then one line per finished piece offset
+    progress = _progress_path(tmp)
+    done = _completed_pieces(progress, tmp, size, piece)
+    if done is None:
+        with open(tmp, "wb") as f:
+            _preallocate(f, size)
+        progress.write_text(f"{size} {piece}\n")
+        done = set()
+    elif done:
+        print(f"Resuming {tmp.name}: {len(done)} pieces already downloaded")
+    pending: queue.SimpleQueue[tuple[int, int, int]] = queue.SimpleQueue()
+    for start in range(0, size, piece):
+        if start not in done:
+            pending.put((start, min(start + piece, size) - 1, 0))
+    controller = _ConcurrencyController(INITIAL_DOWNLOAD_CONNECTIONS, MAX_DOWNLOAD_CONNECTIONS)
+    progress_lock = threading.Lock()
+    failed = threading.Event()
+
+    def worker() -> None:
+        # Every worker thread exists up front; the controller decides how many run at once
+        while not failed.is_set():
+            try:
+                start, end, attempt = pending.get_nowait()
+            except queue.Empty:
+                return
+            controller.acquire()
+            # Another worker may have failed while this one waited for a slot
+            if failed.is_set():
+                controller.release()
+                return
+            try:
+                _download_range(url, tmp, start, end)
+            except requests.HTTPError as e:
+                status = e.response.status_code if e.response is not None else None
+                if status not in _THROTTLE_STATUSES or attempt >= _MAX_THROTTLE_RETRIES:
+                    # Flag the failure before freeing the slot, so no waiter slips through
+                    failed.set()
+                    controller.release()
+                    raise
+                # Free the slot first; a throttled worker must not hold it while sleeping
+                controller.release()
+                controller.throttled()
+                retry_sleep(attempt)
+                pending.put((start, end, attempt + 1))
+                continue
+            except BaseException:
+                failed.set()
+                controller.release()
+                raise
+            controller.release(end - start + 1)
+            with progress_lock, open(progress, "a") as f:
+                f.write(f"{start}\n")
+
+    with ThreadPoolExecutor(max_workers=MAX_DOWNLOAD_CONNECTIONS) as ex:
+        for future in [ex.submit(worker) for _ in range(MAX_DOWNLOAD_CONNECTIONS)]:
+            future.result()
+
+
+def _download_single(url: str, tmp: Path) -> None:
+    progress = _progress_path(tmp)
+    if progress.exists():
+        # Left by a ranged attempt: that .part is preallocated, not a downloaded prefix
+        progress.unlink()
+        tmp.unlink(missing_ok=True)
+    start = tmp.stat().st_size if tmp.exists() else 0
+    headers = {"Range": f"bytes={start}-"} if start else {}
+    with _SESSION.get(url, headers=headers, stream=True, timeout=_TIMEOUT) as r:
+        if start and r.status_code == 416:
+            # The server rejects the offset (file changed or already complete); start over
+            tmp.unlink()
+            return _download_single(url, tmp)
+        r.raise_for_status()
+        resume = bool(start) and r.status_code == 206 and \
+            r.headers.get("Content-Range", "").startswith(f"bytes {start}-")
+        if resume:
+            print(f"Resuming {tmp.name} from byte {start}")
+        # A 200 means the server ignored the range: truncate and take the whole body
+        with open(tmp, "ab" if resume else "wb") as f:
+            # Stream in 1 MiB chunks; the GGUF is several GB and must not be held in memory
+            shutil.copyfileobj(r.raw, f, length=CHUNK_SIZE)
+
+
+def _fsync_dir(path: Path) -> None:
+    # Makes a rename durable; Windows has no O_DIRECTORY and cannot open directories
+    if not hasattr(os, "O_DIRECTORY"):
+        return
+    dfd = os.open(path, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        os.fsync(dfd)
+    finally:
+        os.close(dfd)
+
+
+def _fastest_mirror(urls: Sequence[str], etag: str | None) -> tuple[str, _Probe]:
+    """Probes every mirror at once and returns the first to answer, with its probe"""
+    ex = ThreadPoolExecutor(max_workers=len(urls))
+    futures = {ex.submit(_probe, url, etag): url for url in urls}
+    error: Exception | None = None
+    try:
+        for future in as_completed(futures):
+            try:
+                return futures[future], future.result()
+            except requests.RequestException as e:
+                error = e
+        raise error
+    finally:
+        # Slower probes finish in the background; nobody waits for them
+        ex.shutdown(wait=False, cancel_futures=True)
+
+
+def _fetch(url: str, tmp: Path, probe: _Probe, expected: str | None) -> None:
+    try:
+        if probe.size is None or probe.size < MIN_RANGED_BYTES:
+            raise _RangeNotSupported("ranges unavailable or not worth it")
+        _download_ranged(url, tmp, probe.size)
+    except _RangeNotSupported:
+        _download_single(url, tmp)
+    if expected is not None:
+        actual = sha256_file(tmp)
+        if actual != expected:
+            # Start from scratch next time rather than resuming into corrupt data
+            tmp.unlink()
+            _progress_path(tmp).unlink(missing_ok=True)
+            raise IOError(f"{tmp.name}: SHA-256 {actual} does not match expected {expected}")
+
+
+def download_file(urls: str | Sequence[str], dest: Path, etag: str | None = None) -> str | None:
+    """Downloads dest from the fastest of urls and returns its ETag
+
+    With etag given, an unchanged dest is kept. Mirrors that fail mid-download are skipped
+    in favour of the next one.
+    """
+    urls = [urls] if isinstance(urls, str) else list(urls)
+    url, probe = _fastest_mirror(urls, etag if dest.exists() else None)
+    if probe.not_modified:
+        print(f"{dest.name} is up to date")
+        return etag
+    print(f"Downloading {dest.name} from {url}...")
     dest.parent.mkdir(parents=True, exist_ok=True)
     tmp = dest.with_suffix(dest.suffix + ".part")
-    with urllib.request.urlopen(url) as r, open(tmp, "wb") as f:
-        f.write(r.read())
+    candidates = [url, *(u for u in urls if u != url)]
+    for i, url in enumerate(candidates):
+        try:
+            if i:
+                probe = _probe(url)
+            _fetch(url, tmp, probe, EXPECTED_SHA256.get(dest.name, probe.digest))
+            break
+        except (requests.RequestException, OSError) as e:
+            if i == len(candidates) - 1:
+                raise
+            print(f"{url} failed ({e}); trying {candidates[i + 1]}")
+    # Data must be on disk before the rename is, or a crash can leave an empty model file
+    with open(tmp, "rb+") as f:
+        os.fsync(f.fileno())
+    # .part lives next to dest, so this is a same-filesystem atomic rename
     tmp.replace(dest)
+    _fsync_dir(dest.parent)
+    _progress_path(tmp).unlink(missing_ok=True)
+    print(f"Finished {dest.name}")
+    return probe.etag
+
+
+def download_whisper_model(name: str) -> None:
+    # faster-whisper fetches into the Hugging Face cache on first use; warming it here
+    # keeps that download out of the first transcription
+    try:
+        from faster_whisper import download_model  # type: ignore
+    except ImportError:
+        print("faster-whisper not installed; skipping Whisper model download.")
+        return
+    print(f"Downloading Whisper model '{name}'...")
+    download_model(name)
+    print(f"Finished Whisper model '{name}'")
 
 
 def setup_models() -> None:
     models_dir = Path("./models")
     models_dir.mkdir(exist_ok=True)
 
+    settings_path = ROOT / "config" / "settings.json"
+    settings = load_json(settings_path) if settings_path.exists() else {}
+
+    # ETags of earlier downloads, so an unchanged model costs one round trip instead of gigabytes
+    etags_path = models_dir / ".etags.json"
+    etags = load_json(etags_path) if etags_path.exists() else {}
+
+    whisper_name = settings.get("stt", {}).get("model", "base")
+    # Primary first; the first URL also keys the ETag cache
+    llm_urls = [
+        "https://huggingface.co/microsoft/Phi-3-mini-4k-instruct-gguf/resolve/main/Phi-3-mini-4k-instruct-q4.gguf",
+        "https://hf-mirror.com/microsoft/Phi-3-mini-4k-instruct-gguf/resolve/main/Phi-3-mini-4k-instruct-q4.gguf",
+    ]
+    llm_url = llm_urls[0]
     llm_model = models_dir / "phi-3-mini-4k-instruct-q4.gguf"
-    if not llm_model.exists():
-        print("Downloading LLM model...")
-        download_file(
-            "https://huggingface.co/microsoft/Phi-3-mini-4k-instruct-gguf/resolve/main/Phi-3-mini-4k-instruct-q4.gguf",
-            llm_model,
-        )
-
-    if not tesseract_installed():
-        print("Please install Tesseract OCR:")
-        print("  Windows: https://github.com/UB-Mannheim/tesseract/wiki")
-        print("  macOS: brew install tesseract")
-        print("  Linux: sudo apt install tesseract-ocr")
 
+    # Independent transfers; run them side by side so neither waits on the other
+    with ThreadPoolExecutor(max_workers=3) as ex:
+        # The PATH scan hides behind the downloads, and the hint shows while they still run
+        tesseract = ex.submit(tesseract_installed)
+        whisper = ex.submit(download_whisper_model, whisper_name)
+        llm = None
+        # A model installed before ETags were recorded has nothing to revalidate against; keep it
+        if not llm_model.exists() or llm_url in etags:
+            llm = ex.submit(download_file, llm_urls, llm_model, etags.get(llm_url))
+        if not tesseract.result():
+            print("Please install Tesseract OCR:")
+            print("  Windows: https://github.com/UB-Mannheim/tesseract/wiki")
+            print("  macOS: brew install tesseract")
+            print("  Linux: sudo apt install tesseract-ocr")
+        whisper.result()
+        llm_etag = llm.result() if llm else None
+
+    if llm_etag and etags.get(llm_url) != llm_etag:
+        etags[llm_url] = llm_etag
+        save_json(etags_path, etags)
 
 if __name__ == "__main__":
     setup_models()
\ No newline at end of file